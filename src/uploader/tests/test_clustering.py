@@ -0,0 +1,47 @@
+"""Tests for face clustering."""
+
+import numpy as np
+import pytest
+
+pytest.importorskip("scipy")
+pytest.importorskip("sklearn")
+
+from sklearn.cluster import DBSCAN
+
+from uploader import clustering
+
+THRESHOLD = 0.3
+MIN_SAMPLES = 3
+
+
+@pytest.fixture
+def embeddings() -> np.ndarray:
+    """Tight groups around random directions plus scattered noise faces."""
+    rng = np.random.default_rng(42)
+    dim = 64
+    centers = rng.standard_normal((6, dim))
+    groups = [center + 0.05 * rng.standard_normal((20, dim)) for center in centers]
+    noise = rng.standard_normal((15, dim))
+    data = np.vstack([*groups, noise]).astype(np.float32)
+    return data[rng.permutation(len(data))]
+
+
+def _dense_labels(embeddings: np.ndarray) -> np.ndarray:
+    return DBSCAN(eps=THRESHOLD, min_samples=MIN_SAMPLES, metric="cosine").fit(embeddings).labels_
+
+
+def test_sklearn_graph_matches_dense_dbscan(embeddings, monkeypatch):
+    monkeypatch.setattr(clustering, "faiss", None)
+
+    labels = clustering.cluster_embeddings(embeddings, THRESHOLD, MIN_SAMPLES)
+
+    np.testing.assert_array_equal(labels, _dense_labels(embeddings))
+    assert len(set(labels) - {-1}) == 6
+
+
+def test_faiss_graph_matches_dense_dbscan(embeddings):
+    pytest.importorskip("faiss")
+
+    labels = clustering.cluster_embeddings(embeddings, THRESHOLD, MIN_SAMPLES)
+
+    np.testing.assert_array_equal(labels, _dense_labels(embeddings))
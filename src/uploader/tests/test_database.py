@@ -0,0 +1,150 @@
+"""Database tests that need a scratch PostgreSQL database.
+
+Set UPLOADER_TEST_DATABASE_URL to a libpq connection string to run them; each
+test works in its own schema, which is dropped afterwards.
+"""
+
+import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from uuid import uuid4
+
+import pytest
+
+psycopg = pytest.importorskip("psycopg")
+pytest.importorskip("pgvector")
+
+from uploader.database import Database
+
+TEST_DATABASE_URL = os.environ.get("UPLOADER_TEST_DATABASE_URL")
+
+pytestmark = pytest.mark.skipif(
+    not TEST_DATABASE_URL, reason="UPLOADER_TEST_DATABASE_URL is not set"
+)
+
+HIERARCHY = {
+    "country": ("Sverige", "Sweden"),
+    "state": ("Stockholms län", "Stockholm County"),
+    "city": ("Stockholm", "Stockholm"),
+    "street": ("Drottninggatan", "Drottninggatan"),
+}
+
+
+class _ScratchDatabase(Database):
+    """Database bound to one plain connection per thread, outside the pool."""
+
+    def __init__(self, schema: str):
+        super().__init__(host="", database="", user="")
+        self._schema = schema
+
+    @property
+    def _conn(self):
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            conn = psycopg.connect(TEST_DATABASE_URL, options=f"-c search_path={self._schema}")
+            self._local.conn = conn
+            with self._bound_lock:
+                self._bound.append(conn)
+        return conn
+
+    def close(self) -> None:
+        with self._bound_lock:
+            for conn in self._bound:
+                conn.close()
+            self._bound.clear()
+
+
+@pytest.fixture
+def db():
+    schema = f"uploader_test_{uuid4().hex[:12]}"
+    with psycopg.connect(TEST_DATABASE_URL, autocommit=True) as admin:
+        admin.execute(f"CREATE SCHEMA {schema}")
+        admin.execute(
+            f"CREATE TABLE {schema}.places ("
+            " id uuid PRIMARY KEY,"
+            " name_sv varchar(255) NOT NULL,"
+            " name_en varchar(255) NOT NULL,"
+            " parent_id uuid REFERENCES " + schema + ".places (id),"
+            " type varchar(20) NOT NULL)"
+        )
+        database = _ScratchDatabase(schema)
+        try:
+            yield database
+        finally:
+            database.close()
+            admin.execute(f"DROP SCHEMA {schema} CASCADE")
+
+
+def _place_count(db: _ScratchDatabase) -> int:
+    with db._conn.cursor() as cur:
+        cur.execute("SELECT count(*) FROM places")
+        return cur.fetchone()[0]
+
+
+def test_create_place_hierarchy_is_idempotent(db):
+    first = db.create_place_hierarchy(**HIERARCHY)
+    db.commit()
+    second = db.create_place_hierarchy(**HIERARCHY)
+    db.commit()
+
+    assert first == second
+    assert _place_count(db) == len(HIERARCHY)
+
+
+def test_create_place_hierarchy_reuses_shared_ancestors(db):
+    street = db.create_place_hierarchy(**HIERARCHY)
+    city = db.create_place_hierarchy(
+        country=HIERARCHY["country"], state=HIERARCHY["state"], city=HIERARCHY["city"]
+    )
+    db.commit()
+
+    assert street != city
+    assert _place_count(db) == len(HIERARCHY)
+
+
+def test_create_place_hierarchy_concurrent_workers_share_one_chain(db):
+    workers = 8
+    barrier = threading.Barrier(workers)
+
+    def resolve(_: int):
+        barrier.wait()
+        place_id = db.create_place_hierarchy(**HIERARCHY)
+        db.commit()
+        return place_id
+
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        results = list(executor.map(resolve, range(workers)))
+
+    assert len(set(results)) == 1
+    assert _place_count(db) == len(HIERARCHY)
+
+
+def _advisory_locks_held(db: _ScratchDatabase) -> int:
+    with db._conn.cursor() as cur:
+        cur.execute(
+            "SELECT count(*) FROM pg_locks "
+            "WHERE locktype = 'advisory' AND pid = pg_backend_pid() AND granted"
+        )
+        return cur.fetchone()[0]
+
+
+def test_create_place_hierarchy_commits_new_places_and_releases_lock(db):
+    place_id = db.create_place_hierarchy(**HIERARCHY)
+
+    assert _advisory_locks_held(db) == 0
+    # Visible to other connections without the caller committing
+    with psycopg.connect(TEST_DATABASE_URL, options=f"-c search_path={db._schema}") as other:
+        row = other.execute("SELECT count(*) FROM places WHERE id = %s", (place_id,)).fetchone()
+    assert row[0] == 1
+
+
+def test_create_place_hierarchy_lookup_takes_no_lock(db):
+    expected = db.create_place_hierarchy(**HIERARCHY)
+
+    lock_key = f"places:{HIERARCHY['country'][0]}"
+    with psycopg.connect(TEST_DATABASE_URL) as holder:
+        # Another worker is mid-insert under the same country
+        holder.execute("SELECT pg_advisory_xact_lock(hashtextextended(%s, 0))", (lock_key,))
+        db._conn.execute("SET lock_timeout = '1s'")
+
+        assert db.create_place_hierarchy(**HIERARCHY) == expected
@@ -0,0 +1,78 @@
+"""Tests for folder.yaml loading and caching."""
+
+import os
+
+import pytest
+
+from uploader import folder_metadata
+from uploader.folder_metadata import get_folder_metadata, load_folder_yaml
+
+
+@pytest.fixture
+def parses(monkeypatch):
+    """Start from an empty cache and count the folder.yaml files actually parsed."""
+    monkeypatch.setattr(folder_metadata, "_yaml_cache", {})
+    calls = []
+    real_load = folder_metadata.yaml.load
+
+    def counting_load(stream, Loader):
+        calls.append(stream.name)
+        return real_load(stream, Loader=Loader)
+
+    monkeypatch.setattr(folder_metadata.yaml, "load", counting_load)
+    return calls
+
+
+def _write_yaml(folder, text: str, mtime_ns: int | None = None) -> None:
+    path = folder / "folder.yaml"
+    path.write_text(text, encoding="utf-8")
+    if mtime_ns is not None:
+        os.utime(path, ns=(mtime_ns, mtime_ns))
+
+
+def test_unchanged_file_is_parsed_once(tmp_path, parses):
+    _write_yaml(tmp_path, "place:\n  country: Sverige\n")
+
+    assert load_folder_yaml(tmp_path).place.country == "Sverige"
+    assert load_folder_yaml(tmp_path).place.country == "Sverige"
+    assert len(parses) == 1
+
+
+def test_edited_file_is_parsed_again(tmp_path, parses):
+    _write_yaml(tmp_path, "place:\n  country: Sverige\n", mtime_ns=1_000_000_000)
+    load_folder_yaml(tmp_path)
+
+    _write_yaml(tmp_path, "place:\n  country: Norge\n", mtime_ns=2_000_000_000)
+
+    assert load_folder_yaml(tmp_path).place.country == "Norge"
+    assert len(parses) == 2
+
+
+def test_same_mtime_but_new_size_is_parsed_again(tmp_path, parses):
+    _write_yaml(tmp_path, "place:\n  country: Sverige\n", mtime_ns=1_000_000_000)
+    load_folder_yaml(tmp_path)
+
+    _write_yaml(tmp_path, "place:\n  country: Nederland\n", mtime_ns=1_000_000_000)
+
+    assert load_folder_yaml(tmp_path).place.country == "Nederland"
+
+
+def test_added_and_removed_files_are_seen(tmp_path, parses):
+    assert load_folder_yaml(tmp_path) is None
+
+    _write_yaml(tmp_path, "place:\n  country: Sverige\n")
+    assert load_folder_yaml(tmp_path).place.country == "Sverige"
+
+    (tmp_path / "folder.yaml").unlink()
+    assert load_folder_yaml(tmp_path) is None
+
+
+def test_closer_folder_overrides_parent(tmp_path, parses):
+    child = tmp_path / "2023" / "midsommar"
+    child.mkdir(parents=True)
+    _write_yaml(tmp_path, "place:\n  country: Sverige\n  city: Stockholm\n")
+    _write_yaml(child, "place:\n  city: Dalarö\n")
+
+    place = get_folder_metadata(child / "photo.jpg", root=tmp_path).place
+
+    assert (place.country, place.city) == ("Sverige", "Dalarö")
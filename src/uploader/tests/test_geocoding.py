@@ -0,0 +1,79 @@
+"""Tests for the persistent geocoding cache."""
+
+import json
+
+import pytest
+
+from uploader.geocoding import GeocodedPlace, Geocoder, LocalizedName
+
+STOCKHOLM = (59.3293, 18.0686)
+
+
+@pytest.fixture
+def lookups(monkeypatch):
+    """Record Nominatim lookups instead of sending them."""
+    calls = []
+
+    def fake_lookup(self, lat, lon, cache_key):
+        calls.append(cache_key)
+        self._store(cache_key, None)
+
+    monkeypatch.setattr(Geocoder, "_lookup", fake_lookup)
+    return calls
+
+
+def test_cached_place_survives_restart(tmp_path, lookups):
+    cache_path = tmp_path / "geocode-cache.json"
+    place = GeocodedPlace(country=LocalizedName(sv="Sverige", en="Sweden"))
+    cache_path.write_text(
+        json.dumps({"59.3293,18.0686": {"country": {"sv": "Sverige", "en": "Sweden"}}})
+    )
+
+    geocoder = Geocoder(cache_path=cache_path)
+
+    assert geocoder.reverse_geocode(*STOCKHOLM) == place
+    assert lookups == []
+
+
+@pytest.mark.parametrize(
+    "contents",
+    [b"{not json", b"[1, 2]", b'"text"', b"null"],
+)
+def test_unreadable_cache_file_starts_empty(tmp_path, lookups, capsys, contents):
+    cache_path = tmp_path / "geocode-cache.json"
+    cache_path.write_bytes(contents)
+
+    geocoder = Geocoder(cache_path=cache_path)
+
+    assert "Ignoring unreadable geocode cache" in capsys.readouterr().out
+    assert geocoder.reverse_geocode(*STOCKHOLM) is None
+    assert lookups == [STOCKHOLM]
+    geocoder.flush()
+
+
+@pytest.mark.parametrize(
+    "key, data",
+    [
+        ("bad", None),
+        ("north,east", None),
+        ("59.3293,18.0686", {"country": "Sweden"}),
+        ("59.3293,18.0686", {"country": {"population": 10}}),
+        ("59.3293,18.0686", {"planet": {"en": "Earth"}}),
+        ("59.3293,18.0686", ["Sweden"]),
+    ],
+)
+def test_malformed_entries_are_dropped(tmp_path, lookups, capsys, key, data):
+    cache_path = tmp_path / "geocode-cache.json"
+    good = {"country": {"sv": "Norge", "en": "Norway"}}
+    cache_path.write_text(json.dumps({key: data, "59.9139,10.7522": good}))
+
+    geocoder = Geocoder(cache_path=cache_path)
+
+    assert "Ignoring unreadable geocode cache" in capsys.readouterr().out
+    assert geocoder.reverse_geocode(59.9139, 10.7522) == GeocodedPlace.from_dict(good)
+    assert geocoder.reverse_geocode(*STOCKHOLM) is None
+    assert lookups == [STOCKHOLM]
+
+    # The next save keeps the good entry and leaves the malformed one out
+    geocoder.flush()
+    assert json.loads(cache_path.read_text()) == {"59.9139,10.7522": good, "59.3293,18.0686": None}
@@ -0,0 +1,94 @@
+"""Tests for SHA-256 hashing and the persistent hash cache."""
+
+import hashlib
+import os
+
+import pytest
+
+from uploader import hash as hash_module
+from uploader.hash import HashCache, compute_sha256
+
+
+@pytest.fixture
+def photo(tmp_path):
+    path = tmp_path / "photo.jpg"
+    path.write_bytes(b"original bytes")
+    return path
+
+
+@pytest.fixture
+def hash_calls(monkeypatch):
+    """Count the files HashCache actually hashes."""
+    calls = []
+
+    def counting_sha256(file_path):
+        calls.append(file_path)
+        return compute_sha256(file_path)
+
+    monkeypatch.setattr(hash_module, "compute_sha256", counting_sha256)
+    return calls
+
+
+def test_compute_sha256_matches_hashlib(photo):
+    assert compute_sha256(photo) == hashlib.sha256(b"original bytes").hexdigest()
+
+
+def test_repeat_lookup_is_a_hit(photo, hash_calls):
+    cache = HashCache()
+
+    first = cache.compute(photo)
+    second = cache.compute(photo)
+
+    assert first == second
+    assert len(hash_calls) == 1
+
+
+def test_size_change_invalidates(photo, hash_calls):
+    cache = HashCache()
+    cache.compute(photo)
+    st = os.stat(photo)
+
+    photo.write_bytes(b"edited, now longer")
+    os.utime(photo, ns=(st.st_atime_ns, st.st_mtime_ns))
+
+    assert cache.compute(photo) == hashlib.sha256(b"edited, now longer").hexdigest()
+    assert len(hash_calls) == 2
+
+
+def test_mtime_change_invalidates(photo, hash_calls):
+    cache = HashCache()
+    cache.compute(photo)
+    st = os.stat(photo)
+
+    photo.write_bytes(b"edited  bytes!")  # Same size as the original
+    os.utime(photo, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000))
+
+    assert cache.compute(photo) == hashlib.sha256(b"edited  bytes!").hexdigest()
+    assert len(hash_calls) == 2
+
+
+def test_saved_entries_are_reused_by_a_new_cache(tmp_path, photo, hash_calls):
+    cache_path = tmp_path / "cache" / "hash-cache.json"
+    HashCache(cache_path).compute(photo)
+    HashCache(cache_path).save()  # Nothing new to write: must not clobber the file
+    assert not cache_path.exists()
+
+    cache = HashCache(cache_path)
+    cache.compute(photo)
+    cache.save()
+
+    reloaded = HashCache(cache_path)
+    assert reloaded.compute(photo) == compute_sha256(photo)
+    assert len(hash_calls) == 2
+
+
+@pytest.mark.parametrize("contents", [b"{not json", b"[1, 2, 3]", b'"text"'])
+def test_unreadable_cache_file_starts_empty(tmp_path, photo, hash_calls, capsys, contents):
+    cache_path = tmp_path / "hash-cache.json"
+    cache_path.write_bytes(contents)
+
+    cache = HashCache(cache_path)
+
+    assert "Ignoring unreadable hash cache" in capsys.readouterr().out
+    assert cache.compute(photo) == compute_sha256(photo)
+    assert len(hash_calls) == 1
@@ -0,0 +1,95 @@
+"""Tests for EXIF parsing and orientation handling."""
+
+from datetime import datetime
+from fractions import Fraction
+
+import numpy as np
+import pytest
+from PIL import Image, ImageOps
+from PIL.TiffImagePlugin import IFDRational
+
+from uploader.image_processing import (
+    _convert_to_degrees,
+    _parse_exif_datetime,
+    apply_exif_orientation,
+    get_image_dimensions,
+)
+
+ORIENTATION = 274
+
+
+@pytest.mark.parametrize(
+    ("value", "expected"),
+    [
+        ("2023:07:14 18:05:09", datetime(2023, 7, 14, 18, 5, 9)),
+        ("2023:07:14 18:05:09\x00", datetime(2023, 7, 14, 18, 5, 9)),
+        ("0000:00:00 00:00:00", None),
+        ("    :  :     :  :  ", None),
+        ("", None),
+        ("2023:13:01 00:00:00", None),
+        (None, None),
+    ],
+)
+def test_parse_exif_datetime(value, expected):
+    assert _parse_exif_datetime(value) == expected
+
+
+@pytest.mark.parametrize(
+    ("value", "ref", "expected"),
+    [
+        ((IFDRational(59), IFDRational(19), IFDRational(4320, 100)), "N", 59.3287),
+        ((IFDRational(18), IFDRational(4), IFDRational(1230, 100)), "E", 18.0701),
+        ((59, 19, 43.2), "S", -59.3287),
+        ((Fraction(18), Fraction(4), Fraction(123, 10)), "W", -18.0701),
+        (IFDRational(5932870, 100000), "N", 59.3287),
+        (59.3287, None, 59.3287),
+        ((59, 19), "N", None),
+        ((IFDRational(59), IFDRational(19, 0), IFDRational(0)), "N", None),
+        ("not a coordinate", "N", None),
+    ],
+)
+def test_convert_to_degrees(value, ref, expected):
+    result = _convert_to_degrees(value, ref)
+    if expected is None:
+        assert result is None
+    else:
+        assert result == pytest.approx(expected, abs=1e-4)
+
+
+def _save_with_orientation(path, orientation: int, size=(6, 4)) -> None:
+    width, height = size
+    pixels = np.arange(width * height * 3, dtype=np.uint8).reshape(height, width, 3)
+    exif = Image.Exif()
+    exif[ORIENTATION] = orientation
+    # PNG keeps the pixels exact, so orientation results can be compared bit for bit
+    Image.fromarray(pixels).save(path, exif=exif.tobytes())
+
+
+@pytest.mark.parametrize("orientation", range(1, 9))
+def test_get_image_dimensions_applies_orientation(tmp_path, orientation):
+    path = tmp_path / "photo.png"
+    _save_with_orientation(path, orientation)
+
+    expected = (4, 6) if orientation >= 5 else (6, 4)
+    assert get_image_dimensions(path) == expected
+
+
+def test_get_image_dimensions_without_exif(tmp_path):
+    path = tmp_path / "photo.png"
+    Image.new("RGB", (6, 4)).save(path)
+
+    assert get_image_dimensions(path) == (6, 4)
+
+
+@pytest.mark.parametrize("orientation", range(1, 9))
+def test_apply_exif_orientation_matches_exif_transpose(tmp_path, orientation):
+    path = tmp_path / "photo.png"
+    _save_with_orientation(path, orientation)
+
+    with Image.open(path) as img:
+        oriented = np.asarray(apply_exif_orientation(img))
+    with Image.open(path) as img:
+        expected = np.asarray(ImageOps.exif_transpose(img))
+
+    np.testing.assert_array_equal(oriented, expected)
+    assert oriented.shape[1::-1] == get_image_dimensions(path)
@@ -0,0 +1,74 @@
+"""Face clustering on embedding vectors."""
+
+import numpy as np
+from scipy import sparse
+from sklearn.cluster import DBSCAN
+from sklearn.neighbors import radius_neighbors_graph
+
+# FAISS is optional: without it scikit-learn builds the neighbor graph
+try:
+    import faiss
+except ImportError:
+    faiss = None
+
+
+def normalize(embeddings: np.ndarray) -> np.ndarray:
+    """L2-normalize embedding rows so dot product equals cosine similarity."""
+    embeddings = np.ascontiguousarray(embeddings, dtype=np.float32)
+    norms = np.linalg.norm(embeddings, axis=1, keepdims=True)
+    return embeddings / norms
+
+
+def cosine_neighbor_graph(embeddings: np.ndarray, threshold: float) -> sparse.csr_matrix:
+    """Build a sparse cosine-distance graph of all pairs within threshold.
+
+    Uses an exact FAISS inner-product range search, so only neighboring pairs
+    are ever materialized instead of the full N x N matrix.
+
+    Args:
+        embeddings: L2-normalized float32 embeddings, shape (N, D).
+        threshold: Maximum cosine distance for two faces to be neighbors.
+
+    Returns:
+        CSR matrix of cosine distances for pairs within threshold.
+    """
+    n, dim = embeddings.shape
+    index = faiss.IndexFlatIP(dim)
+    index.add(embeddings)
+
+    # Inner product range search returns pairs with similarity above the radius
+    lims, similarities, neighbors = index.range_search(embeddings, 1.0 - threshold)
+    # lims is uint64 (size_t), which np.repeat refuses to cast
+    rows = np.repeat(np.arange(n), np.diff(lims).astype(np.int64))
+    distances = np.clip(1.0 - similarities, 0, 2)
+    return sparse.csr_matrix((distances, (rows, neighbors)), shape=(n, n))
+
+
+def cluster_embeddings(embeddings: np.ndarray, threshold: float, min_samples: int) -> np.ndarray:
+    """Cluster embeddings with DBSCAN on cosine distance.
+
+    Args:
+        embeddings: Embeddings to cluster, shape (N, D).
+        threshold: DBSCAN eps as cosine distance (lower = stricter).
+        min_samples: Minimum faces per cluster.
+
+    Returns:
+        Cluster label per embedding (-1 for noise).
+    """
+    embeddings_normalized = normalize(embeddings)
+
+    if faiss is not None:
+        distance_matrix = cosine_neighbor_graph(embeddings_normalized, threshold)
+    else:
+        # Same sparse graph via brute-force search in bounded row chunks, never N x N at once
+        distance_matrix = radius_neighbors_graph(
+            embeddings_normalized, threshold, mode="distance", metric="cosine", n_jobs=-1
+        )
+
+    clustering = DBSCAN(
+        eps=threshold,
+        min_samples=min_samples,
+        metric="precomputed",
+    ).fit(distance_matrix)
+
+    return clustering.labels_
@@ -1,53 +1,183 @@
 """PostgreSQL database operations."""
 
 import json
+import os
+import threading
+import time
+from dataclasses import dataclass, field
 from datetime import datetime, timezone
+from typing import TYPE_CHECKING
 from uuid import UUID, uuid4
 
+import numpy as np
 import psycopg
+from azure.core.credentials import AccessToken
 from azure.identity import DefaultAzureCredential
+from pgvector import Vector
+from pgvector.psycopg import register_vector
+from psycopg_pool import ConnectionPool
 
 from .image_processing import ExifData
 
+if TYPE_CHECKING:
+    from .faces import DetectedFace
+
+POSTGRES_TOKEN_SCOPE = "https://ossrdbms-aad.database.windows.net/.default"
+
+# Refresh the cached token when it has less than this many seconds left
+TOKEN_REFRESH_MARGIN = 300
+
+# InsightFace buffalo_l embedding size (faces.embedding is vector(512))
+FACE_EMBEDDING_DIM = 512
+
+# Executions before psycopg turns a query into a server-side prepared statement
+PREPARE_THRESHOLD = 1
+
+# Rows per UPDATE ... FROM (VALUES ...) statement when assigning face clusters
+CLUSTER_UPDATE_CHUNK_SIZE = 5000
+
+# Shared across Database instances; DefaultAzureCredential keeps its own token cache
+_credential: DefaultAzureCredential | None = None
+_token: AccessToken | None = None
+_token_lock = threading.Lock()
+
+
+@dataclass
+class StartupIndex:
+    """Existence data loaded once at the start of a multi-file run."""
+
+    photo_ids: set[str] = field(default_factory=set)
+    embedding_photo_ids: set[str] = field(default_factory=set)
+    face_photo_ids: set[str] = field(default_factory=set)
+    photo_places: dict[str, UUID] = field(default_factory=dict)
+    manual_edits: dict[str, set[str]] = field(
+        default_factory=lambda: {"date": set(), "place": set()}
+    )
+
+
+def _uuid4_batch(count: int) -> list[UUID]:
+    """Generate random (version 4) UUIDs from a single os.urandom() call."""
+    raw = os.urandom(16 * count)
+    return [UUID(bytes=raw[i:i + 16], version=4) for i in range(0, 16 * count, 16)]
+
+
+def _get_token() -> str:
+    """Get Entra access token for PostgreSQL.
+
+    The credential and token are cached at module level and the token is
+    only re-acquired when it is close to expiry.
+    """
+    global _credential, _token
+    with _token_lock:
+        if _token is None or _token.expires_on - time.time() < TOKEN_REFRESH_MARGIN:
+            if _credential is None:
+                _credential = DefaultAzureCredential()
+            _token = _credential.get_token(POSTGRES_TOKEN_SCOPE)
+        return _token.token
+
+
+class _EntraConnection(psycopg.Connection):
+    """Connection that authenticates with a fresh Entra token.
+
+    The pool may open new connections long after it was created, so the
+    password is resolved per connection attempt rather than fixed up front.
+    """
+
+    @classmethod
+    def connect(cls, conninfo: str = "", **kwargs):
+        kwargs["password"] = _get_token()
+        return super().connect(conninfo, **kwargs)
+
 
 class Database:
-    """PostgreSQL database client for photo records."""
+    """PostgreSQL database client for photo records.
 
-    def __init__(self, host: str, database: str, user: str):
+    Connections come from a pool. Each thread is bound to its own pooled
+    connection on first use, so a worker's statements (and transaction)
+    always go to the same connection.
+    """
+
+    def __init__(
+        self,
+        host: str,
+        database: str,
+        user: str,
+        max_connections: int = 4,
+        synchronous_commit: bool = True,
+    ):
         """Initialize database connection.
 
         Args:
             host: PostgreSQL host.
             database: Database name.
             user: Username (UPN for Entra auth).
+            max_connections: Maximum pooled connections (one per worker thread).
+            synchronous_commit: Wait for the WAL flush on commit. Only turn this off
+                for runs that write nothing but database rows, which a later run
+                recomputes if a server crash loses their last commits.
         """
         self.host = host
         self.database = database
         self.user = user
-        self._conn: psycopg.Connection | None = None
-
-    def _get_token(self) -> str:
-        """Get Entra access token for PostgreSQL."""
-        credential = DefaultAzureCredential()
-        token = credential.get_token("https://ossrdbms-aad.database.windows.net/.default")
-        return token.token
+        self.max_connections = max_connections
+        self.synchronous_commit = synchronous_commit
+        self._pool: ConnectionPool | None = None
+        self._local = threading.local()
+        self._bound: list[psycopg.Connection] = []
+        self._bound_lock = threading.Lock()
+
+    def _configure_connection(self, conn: psycopg.Connection) -> None:
+        """Prepare a newly opened pooled connection."""
+        # Adapt pgvector values so embeddings can be sent without building text literals
+        register_vector(conn)
+        if not self.synchronous_commit:
+            # Don't wait for the WAL flush. A server crash can lose only the last few
+            # commits, and their photos show up as unprocessed on the next run.
+            conn.execute("SET synchronous_commit = off")
+        conn.commit()
+        # The same handful of per-photo statements repeat for every file; prepare them
+        # server-side from their second execution (psycopg's default waits for five)
+        conn.prepare_threshold = PREPARE_THRESHOLD
+
+    @property
+    def _conn(self) -> psycopg.Connection | None:
+        """Pooled connection bound to the calling thread, or None if not connected."""
+        if self._pool is None:
+            return None
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            conn = self._pool.getconn()
+            self._local.conn = conn
+            with self._bound_lock:
+                self._bound.append(conn)
+        return conn
 
     def connect(self) -> None:
-        """Establish database connection."""
-        token = self._get_token()
-        self._conn = psycopg.connect(
-            host=self.host,
-            dbname=self.database,
-            user=self.user,
-            password=token,
-            sslmode="require",
+        """Open the connection pool."""
+        self._pool = ConnectionPool(
+            min_size=1,
+            max_size=self.max_connections,
+            kwargs={
+                "host": self.host,
+                "dbname": self.database,
+                "user": self.user,
+                "sslmode": "require",
+            },
+            connection_class=_EntraConnection,
+            configure=self._configure_connection,
+            open=True,
         )
 
     def close(self) -> None:
-        """Close database connection."""
-        if self._conn:
-            self._conn.close()
-            self._conn = None
+        """Return bound connections and close the pool."""
+        if self._pool:
+            with self._bound_lock:
+                for conn in self._bound:
+                    self._pool.putconn(conn)
+                self._bound.clear()
+            self._pool.close()
+            self._pool = None
+            self._local = threading.local()
 
     def __enter__(self) -> "Database":
         self.connect()
@@ -56,6 +186,33 @@ class Database:
     def __exit__(self, exc_type, exc_val, exc_tb) -> None:
         self.close()
 
+    def commit(self) -> None:
+        """Commit the calling thread's transaction.
+
+        Write methods don't commit on their own; callers commit once per photo
+        (or per batch) so a photo's rows become visible together.
+        """
+        if not self._conn:
+            raise RuntimeError("Not connected to database")
+        self._conn.commit()
+
+    def rollback(self) -> None:
+        """Roll back the calling thread's transaction."""
+        if not self._conn:
+            raise RuntimeError("Not connected to database")
+        self._conn.rollback()
+
+    def pipeline(self) -> psycopg.Pipeline:
+        """Enter pipeline mode for a sequence of independent writes.
+
+        Statements issued inside the block are sent without waiting for each
+        result, so a photo's writes cost roughly one round-trip instead of one
+        per statement. COPY is not supported in pipeline mode.
+        """
+        if not self._conn:
+            raise RuntimeError("Not connected to database")
+        return self._conn.pipeline()
+
     def photo_exists(self, photo_id: str) -> bool:
         """Check if a photo record exists."""
         if not self._conn:
@@ -94,11 +251,16 @@ class Database:
         place_id: UUID | None = None,
         width: int | None = None,
         height: int | None = None,
+        manual_edits: dict[str, set[str]] | None = None,
     ) -> None:
         """Create or update a photo record.
 
         If the photo exists and has manual edits for date or place,
         those fields will not be overwritten.
+
+        Args:
+            manual_edits: Pre-fetched result of get_all_manual_edit_ids(). When given,
+                manual edits are looked up there instead of queried per photo.
         """
         if not self._conn:
             raise RuntimeError("Not connected to database")
@@ -106,7 +268,13 @@ class Database:
         now = datetime.now(timezone.utc)
 
         # Check for existing manual edits
-        if self.photo_exists(photo_id):
+        if manual_edits is not None:
+            if photo_id in manual_edits.get("date", ()):
+                date_not_earlier_than = None
+                date_not_later_than = None
+            if photo_id in manual_edits.get("place", ()):
+                place_id = None
+        elif self.photo_exists(photo_id):
             if self.has_manual_edits(photo_id, "date"):
                 date_not_earlier_than = None
                 date_not_later_than = None
@@ -130,7 +298,6 @@ class Database:
                 (photo_id, original_filename, date_not_earlier_than, date_not_later_than,
                  place_id, width, height, "visible", now, now),
             )
-        self._conn.commit()
 
     def create_exif_metadata(self, photo_id: str, exif: ExifData) -> None:
         """Create or update EXIF metadata record."""
@@ -159,7 +326,6 @@ class Database:
                 (photo_id, exif.camera_make, exif.camera_model, exif.lens, exif.focal_length,
                  exif.aperture, exif.shutter_speed, exif.iso, exif.taken_at, raw_json),
             )
-        self._conn.commit()
 
     def get_or_create_place(
         self,
@@ -208,7 +374,6 @@ class Database:
                 """,
                 (place_id, name_sv, name_en, place_type, parent_id),
             )
-            self._conn.commit()
             return place_id
 
     def create_place_hierarchy(
@@ -220,30 +385,83 @@ class Database:
     ) -> UUID | None:
         """Create place hierarchy and return the most specific place ID.
 
-        Each argument is a tuple of (name_sv, name_en).
+        Each argument is a tuple of (name_sv, name_en). The chain is first looked
+        up in one read-only statement, which is all an already known place costs.
+
+        Otherwise the whole chain is resolved in a single statement: every level is
+        looked up under its parent and inserted only if missing. The schema has no
+        unique constraint on places, so concurrent workers creating the same new
+        place could each insert it. The insert therefore runs under a
+        transaction-level advisory lock on the top-level name, and is committed
+        right away so the lock isn't held through the rest of the photo's work.
+        Call this before the photo's other writes, which that commit would
+        otherwise include.
 
         Returns:
             UUID of the most specific place, or None if no place data.
         """
-        parent_id: UUID | None = None
-        result_id: UUID | None = None
-
-        if country:
-            result_id = self.get_or_create_place(country[0], country[1], "country", None)
-            parent_id = result_id
-
-        if state:
-            result_id = self.get_or_create_place(state[0], state[1], "state", parent_id)
-            parent_id = result_id
+        if not self._conn:
+            raise RuntimeError("Not connected to database")
 
-        if city:
-            result_id = self.get_or_create_place(city[0], city[1], "city", parent_id)
-            parent_id = result_id
+        levels = [
+            (place_type, names)
+            for place_type, names in (
+                ("country", country), ("state", state), ("city", city), ("street", street),
+            )
+            if names
+        ]
+        if not levels:
+            return None
+        leaf = len(levels) - 1
+
+        lookup_ctes: list[str] = []
+        lookup_params: list = []
+        ctes: list[str] = []
+        params: list = []
+        for i, (place_type, (name_sv, name_en)) in enumerate(levels):
+            if i == 0:
+                parent_sql = "NULL"
+                parent_match = "parent_id IS NULL"
+                found_parent_match = parent_match
+            else:
+                parent_sql = f"(SELECT id FROM level{i - 1})"
+                parent_match = f"parent_id = {parent_sql}"
+                found_parent_match = f"parent_id = (SELECT id FROM found{i - 1})"
+            lookup_ctes.append(
+                f"found{i} AS (SELECT id FROM places "
+                f"WHERE name_sv = %s AND {found_parent_match} LIMIT 1)"
+            )
+            lookup_params.append(name_sv)
+            ctes.append(
+                f"found{i} AS (SELECT id FROM places WHERE name_sv = %s AND {parent_match} LIMIT 1)"
+            )
+            ctes.append(
+                f"created{i} AS (INSERT INTO places (id, name_sv, name_en, type, parent_id) "
+                f"SELECT %s, %s, %s, %s, {parent_sql} "
+                f"WHERE NOT EXISTS (SELECT 1 FROM found{i}) RETURNING id)"
+            )
+            ctes.append(
+                f"level{i} AS (SELECT id FROM found{i} UNION ALL SELECT id FROM created{i})"
+            )
+            params += [name_sv, uuid4(), name_sv, name_en, place_type]
 
-        if street:
-            result_id = self.get_or_create_place(street[0], street[1], "street", parent_id)
+        with self._conn.cursor() as cur:
+            cur.execute(
+                "WITH " + ",\n".join(lookup_ctes) + f"\nSELECT id FROM found{leaf}",
+                lookup_params,
+            )
+            row = cur.fetchone()
+            if row:
+                return row[0]
 
-        return result_id
+            cur.execute(
+                "SELECT pg_advisory_xact_lock(hashtextextended(%s, 0))",
+                (f"places:{levels[0][1][0]}",),
+            )
+            cur.execute("WITH " + ",\n".join(ctes) + f"\nSELECT id FROM level{leaf}", params)
+            row = cur.fetchone()
+        self._conn.commit()
+        return row[0] if row else None
 
     def embedding_exists(self, photo_id: str) -> bool:
         """Check if an image embedding exists for a photo."""
@@ -254,30 +472,26 @@ class Database:
             cur.execute("SELECT 1 FROM image_embeddings WHERE photo_id = %s", (photo_id,))
             return cur.fetchone() is not None
 
-    def create_image_embedding(self, photo_id: str, embedding: list[float]) -> None:
+    def create_image_embedding(self, photo_id: str, embedding: np.ndarray | list[float]) -> None:
         """Create or update image embedding record.
 
         Args:
             photo_id: Photo ID (SHA-256 hash).
-            embedding: List of floats (768 dimensions for DINOv2-base).
+            embedding: Embedding vector (768 dimensions for DINOv2-base).
         """
         if not self._conn:
             raise RuntimeError("Not connected to database")
 
-        # Convert list to pgvector format string: [1.0, 2.0, 3.0] -> '[1.0,2.0,3.0]'
-        vector_str = "[" + ",".join(str(v) for v in embedding) + "]"
-
         with self._conn.cursor() as cur:
             cur.execute(
                 """
                 INSERT INTO image_embeddings (photo_id, embedding)
-                VALUES (%s, %s::vector)
+                VALUES (%s, %s)
                 ON CONFLICT (photo_id) DO UPDATE SET
                     embedding = EXCLUDED.embedding
                 """,
-                (photo_id, vector_str),
+                (photo_id, Vector(embedding)),
             )
-        self._conn.commit()
 
     def faces_exist(self, photo_id: str) -> bool:
         """Check if faces have been processed for a photo."""
@@ -295,7 +509,7 @@ class Database:
         bbox_y: int,
         bbox_width: int,
         bbox_height: int,
-        embedding: list[float],
+        embedding: np.ndarray | list[float],
     ) -> UUID:
         """Create a face record.
 
@@ -305,7 +519,7 @@ class Database:
             bbox_y: Bounding box Y coordinate.
             bbox_width: Bounding box width.
             bbox_height: Bounding box height.
-            embedding: List of floats (512 dimensions for InsightFace).
+            embedding: Embedding vector (512 dimensions for InsightFace).
 
         Returns:
             UUID of the created face.
@@ -314,19 +528,48 @@ class Database:
             raise RuntimeError("Not connected to database")
 
         face_id = uuid4()
-        vector_str = "[" + ",".join(str(v) for v in embedding) + "]"
 
         with self._conn.cursor() as cur:
             cur.execute(
                 """
                 INSERT INTO faces (id, photo_id, bbox_x, bbox_y, bbox_width, bbox_height, embedding)
-                VALUES (%s, %s, %s, %s, %s, %s, %s::vector)
+                VALUES (%s, %s, %s, %s, %s, %s, %s)
                 """,
-                (face_id, photo_id, bbox_x, bbox_y, bbox_width, bbox_height, vector_str),
+                (face_id, photo_id, bbox_x, bbox_y, bbox_width, bbox_height, Vector(embedding)),
             )
-        self._conn.commit()
         return face_id
 
+    def create_faces_bulk(self, photo_id: str, faces: list["DetectedFace"]) -> list[UUID]:
+        """Create face records for a photo in a single COPY stream.
+
+        Args:
+            photo_id: Photo ID (SHA-256 hash).
+            faces: Detected faces with bounding boxes and 512-dim embeddings.
+
+        Returns:
+            UUIDs of the created faces, in the same order as `faces`.
+        """
+        if not self._conn:
+            raise RuntimeError("Not connected to database")
+        if not faces:
+            return []
+
+        face_ids = _uuid4_batch(len(faces))
+
+        with (
+            self._conn.cursor() as cur,
+            cur.copy(
+                "COPY faces (id, photo_id, bbox_x, bbox_y, bbox_width, bbox_height, embedding) "
+                "FROM STDIN"
+            ) as copy,
+        ):
+            for face_id, face in zip(face_ids, faces):
+                copy.write_row((
+                    face_id, photo_id, face.bbox_x, face.bbox_y,
+                    face.bbox_width, face.bbox_height, Vector(face.embedding),
+                ))
+        return face_ids
+
     def get_face_count(self, photo_id: str) -> int:
         """Get the number of faces for a photo."""
         if not self._conn:
@@ -337,25 +580,38 @@ class Database:
             row = cur.fetchone()
             return row[0] if row else 0
 
-    def get_all_face_embeddings(self) -> list[tuple[UUID, list[float]]]:
+    def get_all_face_embeddings(self) -> tuple[list[UUID], np.ndarray]:
         """Get all face embeddings for clustering.
 
+        Rows are streamed through a server-side cursor straight into a
+        preallocated float32 array.
+
         Returns:
-            List of (face_id, embedding) tuples.
+            Tuple of (face_ids, embeddings) where embeddings is an (N, 512) array
+            whose rows line up with face_ids.
         """
         if not self._conn:
             raise RuntimeError("Not connected to database")
 
         with self._conn.cursor() as cur:
-            cur.execute("SELECT id, embedding::text FROM faces")
-            results = []
-            for row in cur.fetchall():
-                face_id = row[0]
-                # Parse pgvector format: '[1.0,2.0,3.0]' -> [1.0, 2.0, 3.0]
-                embedding_str = row[1].strip("[]")
-                embedding = [float(v) for v in embedding_str.split(",")]
-                results.append((face_id, embedding))
-            return results
+            cur.execute("SELECT COUNT(*) FROM faces")
+            count = cur.fetchone()[0]
+
+        face_ids: list[UUID] = []
+        embeddings = np.empty((count, FACE_EMBEDDING_DIM), dtype=np.float32)
+
+        with self._conn.cursor(name="face_embeddings") as cur:
+            cur.itersize = 10000
+            cur.execute("SELECT id, embedding FROM faces")
+            for face_id, embedding in cur:
+                # Faces inserted after the count are left for the next run
+                if len(face_ids) == count:
+                    break
+                embeddings[len(face_ids)] = embedding
+                face_ids.append(face_id)
+        self._conn.commit()
+
+        return face_ids, embeddings[:len(face_ids)]
 
     def update_face_cluster(self, face_id: UUID, cluster_id: str) -> None:
         """Update the cluster_id for a face.
@@ -372,7 +628,6 @@ class Database:
                 "UPDATE faces SET cluster_id = %s WHERE id = %s",
                 (cluster_id, face_id),
             )
-        self._conn.commit()
 
     def update_face_clusters_batch(self, updates: list[tuple[UUID, str]]) -> None:
         """Batch update cluster_ids for faces.
@@ -384,31 +639,92 @@ class Database:
             raise RuntimeError("Not connected to database")
 
         with self._conn.cursor() as cur:
-            cur.executemany(
-                "UPDATE faces SET cluster_id = %s WHERE id = %s",
-                [(cluster_id, face_id) for face_id, cluster_id in updates],
-            )
-        self._conn.commit()
+            # One UPDATE ... FROM (VALUES ...) per chunk instead of one statement per face
+            for start in range(0, len(updates), CLUSTER_UPDATE_CHUNK_SIZE):
+                chunk = updates[start:start + CLUSTER_UPDATE_CHUNK_SIZE]
+                values = ", ".join(["(%s::uuid, %s)"] * len(chunk))
+                cur.execute(
+                    f"""
+                    UPDATE faces SET cluster_id = v.cluster_id
+                    FROM (VALUES {values}) AS v(id, cluster_id)
+                    WHERE faces.id = v.id
+                    """,
+                    [value for face_id, cluster_id in chunk for value in (face_id, cluster_id)],
+                )
 
-    def get_unclustered_face_count(self) -> int:
-        """Get count of faces without cluster assignment."""
+    def get_face_cluster_stats(self) -> tuple[int, int]:
+        """Get unclustered face count and cluster count in one scan of faces.
+
+        Returns:
+            Tuple of (faces without cluster assignment, unique clusters).
+        """
         if not self._conn:
             raise RuntimeError("Not connected to database")
 
         with self._conn.cursor() as cur:
-            cur.execute("SELECT COUNT(*) FROM faces WHERE cluster_id IS NULL")
+            cur.execute(
+                """
+                SELECT COUNT(*) FILTER (WHERE cluster_id IS NULL),
+                       COUNT(DISTINCT cluster_id)
+                FROM faces
+                """
+            )
             row = cur.fetchone()
-            return row[0] if row else 0
+            return (row[0], row[1]) if row else (0, 0)
+
+    def get_unclustered_face_count(self) -> int:
+        """Get count of faces without cluster assignment."""
+        return self.get_face_cluster_stats()[0]
 
     def get_cluster_count(self) -> int:
         """Get count of unique clusters."""
+        return self.get_face_cluster_stats()[1]
+
+    def load_startup_index(self, embeddings: bool = True, faces: bool = True) -> StartupIndex:
+        """Load photo, embedding, face, place and manual edit existence in one query.
+
+        The tables are combined with UNION ALL and streamed through a
+        server-side cursor, so startup costs one round-trip and a single
+        pass per table. Photo places come from the same scan as photo IDs.
+
+        Args:
+            embeddings: Include photo IDs that have embeddings.
+            faces: Include photo IDs that have detected faces.
+
+        Returns:
+            StartupIndex with the requested sets populated.
+        """
         if not self._conn:
             raise RuntimeError("Not connected to database")
 
-        with self._conn.cursor() as cur:
-            cur.execute("SELECT COUNT(DISTINCT cluster_id) FROM faces WHERE cluster_id IS NOT NULL")
-            row = cur.fetchone()
-            return row[0] if row else 0
+        parts = [
+            "SELECT 'photo', id, place_id, NULL::text FROM photos",
+            "SELECT DISTINCT 'edit', photo_id, NULL::uuid, field_type FROM edit_history",
+        ]
+        if embeddings:
+            parts.append(
+                "SELECT 'embedding', photo_id, NULL::uuid, NULL::text FROM image_embeddings"
+            )
+        if faces:
+            parts.append("SELECT DISTINCT 'face', photo_id, NULL::uuid, NULL::text FROM faces")
+
+        index = StartupIndex()
+        with self._conn.cursor(name="startup_index") as cur:
+            cur.itersize = 50000
+            cur.execute(" UNION ALL ".join(parts))
+            for kind, photo_id, place_id, field_type in cur:
+                if kind == "photo":
+                    index.photo_ids.add(photo_id)
+                    if place_id is not None:
+                        index.photo_places[photo_id] = place_id
+                elif kind == "embedding":
+                    index.embedding_photo_ids.add(photo_id)
+                elif kind == "face":
+                    index.face_photo_ids.add(photo_id)
+                else:
+                    index.manual_edits.setdefault(field_type, set()).add(photo_id)
+        self._conn.commit()
+        return index
 
     def get_all_photo_ids(self) -> set[str]:
         """Get all existing photo IDs in the database.
@@ -449,6 +765,23 @@ class Database:
             cur.execute("SELECT DISTINCT photo_id FROM faces")
             return {row[0] for row in cur.fetchall()}
 
+    def get_all_manual_edit_ids(self) -> dict[str, set[str]]:
+        """Get photo IDs with manual edits, grouped by field type.
+
+        Returns:
+            Dictionary mapping field type ('date', 'place') to the set of photo IDs
+            that have manual edits for that field.
+        """
+        if not self._conn:
+            raise RuntimeError("Not connected to database")
+
+        edits: dict[str, set[str]] = {"date": set(), "place": set()}
+        with self._conn.cursor() as cur:
+            cur.execute("SELECT DISTINCT photo_id, field_type FROM edit_history")
+            for photo_id, field_type in cur.fetchall():
+                edits.setdefault(field_type, set()).add(photo_id)
+        return edits
+
     def get_photo_filenames(self, photo_ids: set[str]) -> dict[str, str]:
         """Get original filenames for a set of photo IDs.
 
@@ -1,5 +1,9 @@
 """DINOv2 embeddings for image similarity search."""
 
+import threading
+from concurrent.futures import Future
+
+import numpy as np
 import torch
 from PIL import Image
 from transformers import AutoImageProcessor, AutoModel
@@ -11,7 +15,15 @@ class DINOv2Embedder:
     # Model produces 768-dimensional embeddings (ViT-B/14)
     EMBEDDING_DIM = 768
 
-    def __init__(self, model_name: str = "facebook/dinov2-base", device: str | None = None):
+    # Upper bound on concurrent generate() calls folded into one forward pass
+    MAX_COALESCED_BATCH = 32
+
+    def __init__(
+        self,
+        model_name: str = "facebook/dinov2-base",
+        device: str | None = None,
+        compile_model: bool = False,
+    ):
         """Initialize DINOv2 model.
 
         Args:
@@ -21,6 +33,8 @@ class DINOv2Embedder:
                 - facebook/dinov2-large (1024 dim)
                 - facebook/dinov2-giant (1536 dim)
             device: Device to run on ('cuda', 'cpu', or None for auto).
+            compile_model: Wrap the model with torch.compile. Requires Triton,
+                so it is off by default (not available on Windows).
         """
         self.model_name = model_name
 
@@ -28,30 +42,133 @@ class DINOv2Embedder:
             device = "cuda" if torch.cuda.is_available() else "cpu"
         self.device = device
 
+        # Half precision on GPU; embeddings are cast back to float32 at the boundary
+        self.autocast_dtype = torch.float16 if device == "cuda" else None
+
+        # Reused page-locked staging buffer for host-to-GPU copies (grown on demand)
+        self._pinned: torch.Tensor | None = None
+
+        # One forward pass at a time (also guards the pinned buffer); generate() calls
+        # that arrive meanwhile queue up and run together in the next pass
+        self._forward_lock = threading.Lock()
+        self._pending_lock = threading.Lock()
+        self._pending: list[tuple[torch.Tensor, Future]] = []
+
         self.processor = AutoImageProcessor.from_pretrained(model_name)
         self.model = AutoModel.from_pretrained(model_name).to(device)
         self.model.eval()
+        if compile_model:
+            self.model = torch.compile(self.model, mode="reduce-overhead")
 
-    def generate(self, image: Image.Image) -> list[float]:
-        """Generate embedding for an image.
+    @property
+    def min_input_size(self) -> int:
+        """Shortest image side the preprocessor resizes to; decoding larger is wasted."""
+        size = self.processor.size
+        return size.get("shortest_edge") or min(size["height"], size["width"])
+
+    def preprocess(self, image: Image.Image) -> torch.Tensor:
+        """Convert an image to model input.
+
+        Lets callers drop the full-size image right away and queue only the
+        small (3, H, W) tensor for a later batched forward pass.
 
         Args:
             image: PIL Image to embed.
 
         Returns:
-            List of floats representing the embedding vector.
+            Pixel values tensor on the CPU, shape (3, H, W).
         """
-        # Preprocess image
-        inputs = self.processor(images=image, return_tensors="pt").to(self.device)
+        return self.processor(images=image, return_tensors="pt")["pixel_values"][0]
 
-        # Generate embedding
-        with torch.no_grad():
-            outputs = self.model(**inputs)
+    def embed_batch(self, pixel_values: list[torch.Tensor]) -> np.ndarray:
+        """Generate embeddings for preprocessed images in one forward pass.
+
+        Args:
+            pixel_values: Tensors returned by preprocess().
+
+        Returns:
+            float32 array of shape (len(pixel_values), EMBEDDING_DIM).
+        """
+        with self._forward_lock:
+            return self._forward(pixel_values)
+
+    def _forward(self, pixel_values: list[torch.Tensor]) -> np.ndarray:
+        """Run the model on a batch. Caller must hold _forward_lock."""
+        inputs = torch.stack(pixel_values)
+        if self.device == "cuda":
+            inputs = self._stage_pinned(inputs).to(self.device, non_blocking=True)
+        else:
+            inputs = inputs.to(self.device)
+
+        with (
+            torch.inference_mode(),
+            torch.autocast(
+                self.device, dtype=self.autocast_dtype, enabled=self.autocast_dtype is not None
+            ),
+        ):
+            outputs = self.model(pixel_values=inputs)
             # Use CLS token embedding (first token)
-            embedding = outputs.last_hidden_state[:, 0, :]
+            embeddings = outputs.last_hidden_state[:, 0, :]
+
+        # Keep as float32 ndarray (pgvector stores float32); the adapter sends it in binary form
+        return embeddings.float().cpu().numpy()
 
-        # Convert to list of floats
-        return embedding.squeeze().cpu().tolist()
+    def _stage_pinned(self, batch: torch.Tensor) -> torch.Tensor:
+        """Copy a CPU batch into the reusable pinned buffer and return a view of it.
+
+        Safe to reuse across calls because embed_batch() waits for its results
+        (.cpu()) before returning, so the previous transfer has completed.
+        """
+        if self._pinned is None or self._pinned.numel() < batch.numel():
+            self._pinned = torch.empty(batch.numel(), dtype=batch.dtype, pin_memory=True)
+        staged = self._pinned[: batch.numel()].view(batch.shape)
+        staged.copy_(batch)
+        return staged
+
+    def generate_batch(self, images: list[Image.Image]) -> np.ndarray:
+        """Generate embeddings for several images in one forward pass.
+
+        Args:
+            images: PIL Images to embed.
+
+        Returns:
+            float32 array of shape (len(images), EMBEDDING_DIM).
+        """
+        return self.embed_batch([self.preprocess(image) for image in images])
+
+    def generate(self, image: Image.Image) -> np.ndarray:
+        """Generate embedding for an image.
+
+        Safe to call from several threads: calls that arrive while a forward
+        pass is running are batched into the next one.
+
+        Args:
+            image: PIL Image to embed.
+
+        Returns:
+            float32 array representing the embedding vector.
+        """
+        future: Future = Future()
+        pixel_values = self.preprocess(image)
+        with self._pending_lock:
+            self._pending.append((pixel_values, future))
+
+        with self._forward_lock:
+            # Another thread may already have run our image as part of its batch
+            while not future.done():
+                with self._pending_lock:
+                    batch = self._pending[: self.MAX_COALESCED_BATCH]
+                    del self._pending[: self.MAX_COALESCED_BATCH]
+                try:
+                    embeddings = self._forward([values for values, _ in batch])
+                except Exception as e:  # noqa: BLE001 - handed on to every caller in the batch
+                    for _, waiter in batch:
+                        waiter.set_exception(e)
+                else:
+                    for (_, waiter), embedding in zip(batch, embeddings):
+                        waiter.set_result(embedding)
+
+        return future.result()
 
 
 # Singleton instance for reuse across uploads
@@ -66,13 +183,13 @@ def get_embedder() -> DINOv2Embedder:
     return _embedder
 
 
-def generate_embedding(image: Image.Image) -> list[float]:
+def generate_embedding(image: Image.Image) -> np.ndarray:
     """Generate embedding for an image using the singleton embedder.
 
     Args:
         image: PIL Image to embed.
 
     Returns:
-        List of 768 floats representing the embedding vector.
+        float32 array of 768 values representing the embedding vector.
     """
     return get_embedder().generate(image)
@@ -1,5 +1,6 @@
 """Face detection using InsightFace."""
 
+import threading
 from dataclasses import dataclass
 
 import numpy as np
@@ -15,7 +16,7 @@ class DetectedFace:
     bbox_y: int
     bbox_width: int
     bbox_height: int
-    embedding: list[float]
+    embedding: np.ndarray  # float32, passed straight to the pgvector adapter
 
 
 class FaceDetector:
@@ -33,9 +34,20 @@ class FaceDetector:
         self.det_size = det_size
         self.app = FaceAnalysis(
             name="buffalo_l",
-            providers=["CUDAExecutionProvider", "CPUExecutionProvider"],
+            providers=[
+                # RetinaFace letterboxes every image into a det_size canvas and recognition
+                # sees 112x112 crops, so ORT only ever runs two input shapes: the exhaustive
+                # cuDNN search is paid once per shape and the arena never needs to regrow
+                ("CUDAExecutionProvider", {
+                    "cudnn_conv_algo_search": "EXHAUSTIVE",
+                    "arena_extend_strategy": "kSameAsRequested",
+                }),
+                "CPUExecutionProvider",
+            ],
         )
         self.app.prepare(ctx_id=0, det_size=det_size)
+        # The singleton is shared by batch workers; run one image through the models at a time
+        self._lock = threading.Lock()
 
     def detect(self, image: Image.Image) -> list[DetectedFace]:
         """Detect faces in an image.
@@ -46,15 +58,17 @@ class FaceDetector:
         Returns:
             List of DetectedFace objects.
         """
-        # Convert PIL Image to numpy array (RGB)
-        img_array = np.array(image)
-
-        # InsightFace expects BGR format
-        if len(img_array.shape) == 3 and img_array.shape[2] == 3:
-            img_array = img_array[:, :, ::-1]  # RGB to BGR
+        # InsightFace expects BGR; let Pillow pack BGR bytes directly so we get one
+        # contiguous buffer instead of an RGB copy plus a strided reversed view
+        if image.mode != "RGB":
+            image = image.convert("RGB")
+        width, height = image.size
+        bgr = image.tobytes("raw", "BGR")
+        img_array = np.frombuffer(bgr, dtype=np.uint8).reshape(height, width, 3)
 
         # Detect faces
-        faces = self.app.get(img_array)
+        with self._lock:
+            faces = self.app.get(img_array)
 
         results = []
         for face in faces:
@@ -68,8 +82,8 @@ class FaceDetector:
             bbox_width = x2 - x1
             bbox_height = y2 - y1
 
-            # Extract embedding (512 dimensions)
-            embedding = face.embedding.tolist()
+            # Extract embedding (512 dimensions) as float32 ndarray, no Python list round-trip
+            embedding = face.embedding.astype(np.float32, copy=False)
 
             results.append(DetectedFace(
                 bbox_x=bbox_x,
@@ -1,11 +1,16 @@
 """Folder metadata parsing from folder.yaml sidecar files."""
 
+import os
+import threading
 from dataclasses import dataclass
 from datetime import date
 from pathlib import Path
 
 import yaml
 
+# libyaml's C loader when PyYAML was built with it, else the pure-Python one
+_YamlLoader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
 
 @dataclass
 class DateRange:
@@ -54,15 +59,51 @@ def parse_date(value: str | None) -> date | None:
     return date.fromisoformat(value)
 
 
+# Parsed folder.yaml by path, with the (mtime_ns, size) it was parsed at
+_yaml_cache: dict[str, tuple[int, int, FolderMetadata | None]] = {}
+_yaml_cache_lock = threading.Lock()
+
+
 def load_folder_yaml(folder: Path) -> FolderMetadata | None:
-    """Load folder.yaml from a directory if it exists."""
-    yaml_path = folder / "folder.yaml"
-    if not yaml_path.exists():
+    """Load folder.yaml from a directory if it exists.
+
+    Every call stats the file, so folder.yaml files added, edited or removed
+    during a run are seen; a file is only re-parsed when its mtime or size
+    changed.
+    """
+    return _load_folder_yaml(os.fspath(folder))
+
+
+def _load_folder_yaml(folder: str) -> FolderMetadata | None:
+    """load_folder_yaml() on a plain string path (avoids pathlib allocations in walks)."""
+    # One stat both checks existence and validates the cached parse. Absence is not
+    # cached, so missing and present files are checked the same way on every walk.
+    yaml_path = os.path.join(folder, "folder.yaml")
+    try:
+        st = os.stat(yaml_path)
+    except FileNotFoundError:
         return None
 
-    with open(yaml_path, "r", encoding="utf-8") as f:
-        data = yaml.safe_load(f)
+    with _yaml_cache_lock:
+        cached = _yaml_cache.get(yaml_path)
+    if cached is not None and cached[0] == st.st_mtime_ns and cached[1] == st.st_size:
+        return cached[2]
+
+    try:
+        # Bytes input lets the loader detect the encoding (UTF-8) itself
+        with open(yaml_path, "rb") as f:
+            data = yaml.load(f, Loader=_YamlLoader)
+    except FileNotFoundError:
+        return None  # Removed since the stat
+
+    metadata = _parse_folder_yaml(data)
+    with _yaml_cache_lock:
+        _yaml_cache[yaml_path] = (st.st_mtime_ns, st.st_size, metadata)
+    return metadata
+
 
+def _parse_folder_yaml(data: dict | None) -> FolderMetadata | None:
+    """Build FolderMetadata from parsed folder.yaml contents."""
     if not data:
         return None
 
@@ -105,7 +146,9 @@ def get_folder_metadata(file_path: Path, root: Path | None = None, verbose: bool
         Merged FolderMetadata from all folder.yaml files in the path.
     """
     result = FolderMetadata()
-    folder = file_path.parent
+    # Walk with plain strings; Paths are only built for folders that have metadata
+    folder = os.path.dirname(os.fspath(file_path))
+    root_str = os.fspath(root) if root else None
 
     # Collect all folder.yaml files from root to file (we'll reverse to apply in order)
     metadata_stack: list[tuple[Path, FolderMetadata]] = []
@@ -116,13 +159,12 @@ def get_folder_metadata(file_path: Path, root: Path | None = None, verbose: bool
             print(f"  [folder.yaml] Root boundary: {root}")
 
     while True:
-        yaml_path = folder / "folder.yaml"
         if verbose:
-            print(f"  [folder.yaml] Checking: {yaml_path} ... ", end="")
+            print(f"  [folder.yaml] Checking: {os.path.join(folder, 'folder.yaml')} ... ", end="")
 
-        metadata = load_folder_yaml(folder)
+        metadata = _load_folder_yaml(folder)
         if metadata:
-            metadata_stack.append((folder, metadata))
+            metadata_stack.append((Path(folder), metadata))
             if verbose:
                 print("FOUND")
                 if metadata.date_range:
@@ -132,14 +174,14 @@ def get_folder_metadata(file_path: Path, root: Path | None = None, verbose: bool
         elif verbose:
             print("not found")
 
-        if root and folder == root:
+        if root_str and folder == root_str:
             if verbose:
-                print(f"  [folder.yaml] Stopped at root boundary")
+                print("  [folder.yaml] Stopped at root boundary")
             break
-        parent = folder.parent
+        parent = os.path.dirname(folder)
         if parent == folder:  # Reached filesystem root
             if verbose:
-                print(f"  [folder.yaml] Reached filesystem root")
+                print("  [folder.yaml] Reached filesystem root")
             break
         folder = parent
 
@@ -1,10 +1,26 @@
 """Reverse geocoding using Nominatim."""
 
+import atexit
+import json
+import os
+import threading
 import time
-from dataclasses import dataclass
+from collections.abc import Iterable
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from urllib.parse import urlencode
 
 import click
-import requests
+import urllib3
+
+# orjson parses responses and the cache file faster; stdlib json is the fallback
+try:
+    from orjson import loads as json_loads
+except ImportError:
+    json_loads = json.loads
+
+# Geocoding results survive restarts here, so re-runs don't wait on Nominatim's rate limit
+DEFAULT_CACHE_PATH = Path.home() / ".cache" / "photo-uploader" / "geocode-cache.json"
 
 
 @dataclass
@@ -29,31 +45,138 @@ class GeocodedPlace:
     city: LocalizedName | None = None
     street: LocalizedName | None = None
 
+    @classmethod
+    def from_dict(cls, data: dict) -> "GeocodedPlace":
+        """Rebuild a place from its dataclasses.asdict() form."""
+        return cls(**{
+            level: LocalizedName(**names) if names else None
+            for level, names in data.items()
+        })
+
 
 class Geocoder:
     """Reverse geocoder using OpenStreetMap Nominatim."""
 
     NOMINATIM_URL = "https://nominatim.openstreetmap.org/reverse"
 
+    # Query parameters shared by every lookup; only lat/lon vary per request
+    STATIC_PARAMS = urlencode({
+        "format": "json",
+        "addressdetails": 1,
+        "namedetails": 1,  # Get names in multiple languages
+        "zoom": 18,  # Street-level detail
+        "accept-language": "en,sv",  # Prefer English, then Swedish
+    })
+
     # Nominatim usage policy: max 1 request per second
     MIN_REQUEST_INTERVAL = 1.0
 
-    def __init__(self, user_agent: str = "photo-sharing-uploader/1.0"):
+    # Seconds between rewrites of the cache file; the rest is flushed at exit
+    SAVE_INTERVAL = 30.0
+
+    def __init__(
+        self, user_agent: str = "photo-sharing-uploader/1.0", cache_path: Path | None = None
+    ):
         """Initialize geocoder.
 
         Args:
             user_agent: User-Agent header for Nominatim requests (required by usage policy).
+            cache_path: JSON file to persist results in across runs. None keeps them in memory only.
         """
         self.user_agent = user_agent
+        self.cache_path = cache_path
         self._last_request_time: float = 0
+        self._rate_lock = threading.Lock()
+        # Guards the caches, the in-flight lookups and the cache file
+        self._cache_lock = threading.Lock()
         self._cache: dict[tuple[float, float], GeocodedPlace | None] = {}
+        # Serialized form of the answers Nominatim gave (request errors are not persisted)
+        self._persisted: dict[str, dict | None] = {}
+        self._dirty = False
+        self._last_save_time: float = 0
+        # Locations a worker is currently asking Nominatim about; others wait on the event
+        self._inflight: dict[tuple[float, float], threading.Event] = {}
+        self._load_cache()
+        if cache_path is not None:
+            atexit.register(self.flush)
+
+        # Keep one connection alive between requests instead of a TCP+TLS handshake per lookup.
+        # No retries: a failed lookup is reported and retried on the next run instead.
+        self._http = urllib3.PoolManager(
+            num_pools=1, maxsize=1, retries=False, headers={"User-Agent": user_agent}
+        )
+
+    def _load_cache(self) -> None:
+        """Load persisted results from cache_path, if present."""
+        if self.cache_path is None:
+            return
+        try:
+            with open(self.cache_path, "rb") as f:
+                persisted = json_loads(f.read())
+        except FileNotFoundError:
+            return
+        except ValueError as e:
+            click.echo(f"    Ignoring unreadable geocode cache {self.cache_path}: {e}")
+            return
+        if not isinstance(persisted, dict):
+            click.echo(
+                f"    Ignoring unreadable geocode cache {self.cache_path}: not a JSON object"
+            )
+            return
+
+        skipped = 0
+        for key, data in persisted.items():
+            try:
+                lat, lon = key.split(",")
+                cache_key = (float(lat), float(lon))
+                place = GeocodedPlace.from_dict(data) if data else None
+            except (TypeError, ValueError, AttributeError):
+                # Dropped, so the location is looked up again and the next save omits it
+                skipped += 1
+                continue
+            self._cache[cache_key] = place
+            self._persisted[key] = data
+        if skipped:
+            click.echo(
+                f"    Ignoring unreadable geocode cache {self.cache_path}: "
+                f"{skipped} malformed entries"
+            )
+
+    def _store(self, cache_key: tuple[float, float], place: GeocodedPlace | None) -> None:
+        """Cache a Nominatim answer in memory and, periodically, on disk."""
+        with self._cache_lock:
+            self._cache[cache_key] = place
+            if self.cache_path is None:
+                return
+            self._persisted[f"{cache_key[0]},{cache_key[1]}"] = asdict(place) if place else None
+            self._dirty = True
+            if time.monotonic() - self._last_save_time >= self.SAVE_INTERVAL:
+                self._save()
+
+    def flush(self) -> None:
+        """Write unsaved results to cache_path."""
+        with self._cache_lock:
+            if self._dirty:
+                self._save()
+
+    def _save(self) -> None:
+        """Rewrite the cache file. Caller holds _cache_lock."""
+        # Write to a temp file and swap it in so an interrupted run can't corrupt the cache
+        self.cache_path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = self.cache_path.with_suffix(".tmp")
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(self._persisted, f)
+        os.replace(tmp_path, self.cache_path)
+        self._dirty = False
+        self._last_save_time = time.monotonic()
 
     def _rate_limit(self) -> None:
-        """Ensure we don't exceed Nominatim's rate limit."""
-        elapsed = time.time() - self._last_request_time
-        if elapsed < self.MIN_REQUEST_INTERVAL:
-            time.sleep(self.MIN_REQUEST_INTERVAL - elapsed)
-        self._last_request_time = time.time()
+        """Ensure we don't exceed Nominatim's rate limit (also across worker threads)."""
+        with self._rate_lock:
+            elapsed = time.time() - self._last_request_time
+            if elapsed < self.MIN_REQUEST_INTERVAL:
+                time.sleep(self.MIN_REQUEST_INTERVAL - elapsed)
+            self._last_request_time = time.time()
 
     def _round_coords(self, lat: float, lon: float, precision: int = 4) -> tuple[float, float]:
         """Round coordinates to reduce cache misses for nearby locations.
@@ -62,6 +185,25 @@ class Geocoder:
         """
         return (round(lat, precision), round(lon, precision))
 
+    def prefetch(self, coords: Iterable[tuple[float, float]]) -> int:
+        """Geocode each distinct rounded location once, ahead of per-photo processing.
+
+        Photos from the same place share coordinates to within meters, so this
+        collapses many lookups into one and leaves later calls as cache hits.
+
+        Args:
+            coords: (lat, lon) pairs in decimal degrees.
+
+        Returns:
+            Number of Nominatim requests issued.
+        """
+        pending = {self._round_coords(lat, lon) for lat, lon in coords}
+        with self._cache_lock:
+            pending.difference_update(self._cache)
+        for lat, lon in sorted(pending):
+            self.reverse_geocode(lat, lon)
+        return len(pending)
+
     def reverse_geocode(self, lat: float, lon: float) -> GeocodedPlace | None:
         """Reverse geocode coordinates to a place.
 
@@ -75,39 +217,52 @@ class Geocoder:
         # Round coordinates for cache efficiency
         cache_key = self._round_coords(lat, lon)
 
-        # Check cache
-        if cache_key in self._cache:
-            return self._cache[cache_key]
+        # Check cache, or claim the lookup so concurrent workers don't repeat it
+        with self._cache_lock:
+            if cache_key in self._cache:
+                return self._cache[cache_key]
+            lookup = self._inflight.get(cache_key)
+            owner = lookup is None
+            if owner:
+                lookup = self._inflight[cache_key] = threading.Event()
+
+        if not owner:
+            # Another worker is already asking Nominatim about this spot; use its answer
+            lookup.wait()
+            with self._cache_lock:
+                return self._cache.get(cache_key)
 
+        try:
+            return self._lookup(lat, lon, cache_key)
+        finally:
+            with self._cache_lock:
+                del self._inflight[cache_key]
+            lookup.set()
+
+    def _lookup(
+        self, lat: float, lon: float, cache_key: tuple[float, float]
+    ) -> GeocodedPlace | None:
+        """Ask Nominatim about a location and cache the answer under cache_key."""
         # Rate limit
         self._rate_limit()
 
         try:
-            response = requests.get(
-                self.NOMINATIM_URL,
-                params={
-                    "lat": lat,
-                    "lon": lon,
-                    "format": "json",
-                    "addressdetails": 1,
-                    "namedetails": 1,  # Get names in multiple languages
-                    "zoom": 18,  # Street-level detail
-                    "accept-language": "en,sv",  # Prefer English, then Swedish
-                },
-                headers={"User-Agent": self.user_agent},
-                timeout=10,
-            )
-            response.raise_for_status()
-            data = response.json()
+            url = f"{self.NOMINATIM_URL}?lat={lat}&lon={lon}&{self.STATIC_PARAMS}"
+            response = self._http.request("GET", url, timeout=10.0)
+            if response.status >= 400:
+                raise urllib3.exceptions.HTTPError(f"HTTP {response.status} from Nominatim")
+            data = json_loads(response.data)
 
-        except (requests.RequestException, ValueError) as e:
+        except (urllib3.exceptions.HTTPError, ValueError) as e:
             click.echo(f"    Nominatim error: {e}")
-            self._cache[cache_key] = None
+            # Remembered for this run only, so the next run asks again
+            with self._cache_lock:
+                self._cache[cache_key] = None
             return None
 
         if "address" not in data:
-            print(f"    Nominatim: no address in response")
-            self._cache[cache_key] = None
+            click.echo("    Nominatim: no address in response")
+            self._store(cache_key, None)
             return None
 
         addr = data["address"]
@@ -147,7 +302,7 @@ class Geocoder:
         city_name = result.city.en if result.city else None
         country_name = result.country.en if result.country else None
         click.echo(f"    Nominatim: {city_name or state}, {country_name}")
-        self._cache[cache_key] = result
+        self._store(cache_key, result)
         return result
 
 
@@ -159,7 +314,7 @@ def get_geocoder() -> Geocoder:
     """Get or create the geocoder singleton."""
     global _geocoder
     if _geocoder is None:
-        _geocoder = Geocoder()
+        _geocoder = Geocoder(cache_path=DEFAULT_CACHE_PATH)
     return _geocoder
 
 
@@ -1,8 +1,34 @@
 """SHA-256 hashing for photo identification."""
 
 import hashlib
+import json
+import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
+import click
+
+# orjson reads and writes the cache file faster; stdlib json is the fallback
+try:
+    from orjson import dumps as json_dumps
+    from orjson import loads as json_loads
+except ImportError:
+    json_loads = json.loads
+
+    def json_dumps(obj) -> bytes:
+        """Serialize obj to UTF-8 JSON bytes, like orjson.dumps."""
+        return json.dumps(obj).encode()
+
+
+# Hashes survive restarts here, so re-runs only read files that are new or changed
+DEFAULT_CACHE_PATH = Path.home() / ".cache" / "photo-uploader" / "hash-cache.json"
+
+
+def _sha256_content_address():
+    """Create a SHA-256 hasher for content addressing (not a security use)."""
+    return hashlib.sha256(usedforsecurity=False)
+
 
 def compute_sha256(file_path: Path) -> str:
     """Compute SHA-256 hash of a file.
@@ -13,9 +39,114 @@ def compute_sha256(file_path: Path) -> str:
     Returns:
         Lowercase hex string of the SHA-256 hash (64 characters).
     """
-    sha256 = hashlib.sha256()
-    with open(file_path, "rb") as f:
-        # Read in chunks to handle large files
-        for chunk in iter(lambda: f.read(8192), b""):
-            sha256.update(chunk)
-    return sha256.hexdigest()
+    with open(file_path, "rb", buffering=0) as f:
+        if hasattr(os, "posix_fadvise"):
+            # Whole file is read front to back: let the kernel read ahead aggressively
+            os.posix_fadvise(f.fileno(), 0, 0, os.POSIX_FADV_SEQUENTIAL)
+        # file_digest loops in Python over a reused 256 KiB buffer, but readinto() and
+        # OpenSSL's update() both release the GIL, so per-chunk overhead is negligible
+        return hashlib.file_digest(f, _sha256_content_address).hexdigest()
+
+
+def compute_sha256_many(paths: list[Path], workers: int = 8) -> list[str]:
+    """Compute SHA-256 hashes of many files concurrently.
+
+    hashlib releases the GIL while hashing, so threads overlap both disk reads
+    and hashing. Use fewer workers on spinning disks to avoid seek thrashing.
+
+    Args:
+        paths: Files to hash.
+        workers: Number of files hashed at once.
+
+    Returns:
+        Hex digests in the same order as paths.
+    """
+    cache = get_hash_cache()
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        digests = list(executor.map(cache.compute, paths))
+    cache.save()
+    return digests
+
+
+class HashCache:
+    """SHA-256 results keyed by absolute path, trusted while size and mtime match."""
+
+    def __init__(self, cache_path: Path | None = None):
+        """Initialize the cache.
+
+        Args:
+            cache_path: JSON file to persist hashes in across runs. None keeps them in memory only.
+        """
+        self.cache_path = cache_path
+        # path -> [size, mtime_ns, hex digest]
+        self._entries: dict[str, list] = {}
+        self._dirty = False
+        self._lock = threading.Lock()
+        self._load()
+
+    def _load(self) -> None:
+        """Load persisted hashes from cache_path, if present."""
+        if self.cache_path is None:
+            return
+        try:
+            with open(self.cache_path, "rb") as f:
+                entries = json_loads(f.read())
+        except FileNotFoundError:
+            return
+        except ValueError as e:
+            # Start over: files are simply hashed again
+            click.echo(f"Ignoring unreadable hash cache {self.cache_path}: {e}")
+            return
+        if not isinstance(entries, dict):
+            click.echo(f"Ignoring unreadable hash cache {self.cache_path}: not a JSON object")
+            return
+        self._entries = entries
+
+    def compute(self, file_path: Path) -> str:
+        """Return the file's SHA-256, hashing it only if it is new or has changed.
+
+        Args:
+            file_path: Path to the file to hash.
+
+        Returns:
+            Lowercase hex string of the SHA-256 hash (64 characters).
+        """
+        key = os.path.abspath(file_path)
+        st = os.stat(key)
+        with self._lock:
+            entry = self._entries.get(key)
+        if entry is not None and entry[0] == st.st_size and entry[1] == st.st_mtime_ns:
+            return entry[2]
+
+        digest = compute_sha256(file_path)
+        with self._lock:
+            self._entries[key] = [st.st_size, st.st_mtime_ns, digest]
+            self._dirty = True
+        return digest
+
+    def save(self) -> None:
+        """Write the cache to cache_path if anything was hashed since the last save."""
+        if self.cache_path is None:
+            return
+        with self._lock:
+            if not self._dirty:
+                return
+            # Write to a temp file and swap it in so an interrupted run can't corrupt the cache
+            self.cache_path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path = self.cache_path.with_suffix(".tmp")
+            with open(tmp_path, "wb") as f:
+                f.write(json_dumps(self._entries))
+            os.replace(tmp_path, self.cache_path)
+            self._dirty = False
+
+
+# Singleton instance shared by all commands in the process
+_hash_cache: HashCache | None = None
+
+
+def get_hash_cache() -> HashCache:
+    """Get or create the hash cache singleton."""
+    global _hash_cache
+    if _hash_cache is None:
+        _hash_cache = HashCache(cache_path=DEFAULT_CACHE_PATH)
+    return _hash_cache
@@ -1,20 +1,54 @@
 """Image processing: resizing and EXIF extraction."""
 
 import io
-import json
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from datetime import datetime
+from functools import cached_property
 from pathlib import Path
 
 from PIL import Image
-from PIL.ExifTags import TAGS, GPSTAGS, IFD, Base
+from PIL.ExifTags import IFD, TAGS
 
-# Register HEIC/HEIF support
+HEIF_SUFFIXES = frozenset({".heic", ".heif"})
+_heif_registered = False
+
+# libvips resizes and encodes with SIMD kernels; Pillow is the fallback
 try:
-    import pillow_heif
-    pillow_heif.register_heif_opener()
-except ImportError:
-    pass  # HEIC support optional
+    import pyvips
+except (ImportError, OSError):  # OSError: binding installed but libvips isn't
+    pyvips = None
+
+# Encode options that drop all metadata (EXIF/GPS, XMP, ICC) from libvips output
+if pyvips is not None and pyvips.at_least_libvips(8, 15):
+    _VIPS_STRIP = {"keep": "none"}
+else:
+    _VIPS_STRIP = {"strip": True}
+
+# Inputs are the user's own photos, not untrusted uploads: don't reject large panoramas
+# as decompression bombs
+Image.MAX_IMAGE_PIXELS = None
+
+THUMBNAIL_SIZE = 100
+# Prioritizes small file size at 100px
+THUMBNAIL_QUALITY = 60
+
+DEFAULT_VIEW_SIZE = 2048
+DEFAULT_VIEW_QUALITY = 92
+
+# Decode JPEGs at reduced scale (libjpeg DCT scaling) when this much resolution is enough
+THUMBNAIL_DRAFT_SIZE = 800
+
+# EXIF Orientation -> transpose that shows the image upright, matching ImageOps.exif_transpose
+# and libvips autorotate. Orientations 5-8 swap width and height.
+_ORIENTATION_TRANSPOSE = {
+    2: Image.Transpose.FLIP_LEFT_RIGHT,
+    3: Image.Transpose.ROTATE_180,
+    4: Image.Transpose.FLIP_TOP_BOTTOM,
+    5: Image.Transpose.TRANSPOSE,
+    6: Image.Transpose.ROTATE_270,
+    7: Image.Transpose.TRANSVERSE,
+    8: Image.Transpose.ROTATE_90,
+}
 
 
 @dataclass
@@ -31,37 +65,80 @@ class ExifData:
     taken_at: datetime | None = None
     gps_lat: float | None = None
     gps_lon: float | None = None
-    raw_exif: dict | None = None
+    # All decoded tags by name; raw_exif is derived from these when first needed
+    tags: dict | None = field(default=None, repr=False)
+
+    @cached_property
+    def raw_exif(self) -> dict | None:
+        """All EXIF tags as JSON-serializable values (non-serializable ones as str)."""
+        if self.tags is None:
+            return None
+        return {
+            key: value if _is_json_safe(value) else str(value)
+            for key, value in self.tags.items()
+            if key != "GPSInfo"  # Skip binary GPS data
+        }
+
+
+def _register_heif() -> None:
+    """Register HEIC/HEIF support with Pillow on first use."""
+    global _heif_registered
+    if _heif_registered:
+        return
+    _heif_registered = True
+    try:
+        import pillow_heif
+        pillow_heif.register_heif_opener()
+    except ImportError:
+        pass  # HEIC support optional
+
+
+def _open_image(file_path: Path) -> Image.Image:
+    """Open an image file, loading HEIF support only when the file needs it."""
+    if Path(file_path).suffix.lower() in HEIF_SUFFIXES:
+        _register_heif()
+    return Image.open(file_path)
+
+
+def _draft_to_fit(image: Image.Image, max_size: int) -> None:
+    """Let an undecoded JPEG decode at reduced scale while its long edge stays >= max_size.
+
+    draft() keeps both sides at least as large as the requested box, so asking for a
+    max_size square would keep full scale whenever the short side is under 2 * max_size.
+    The box is therefore the image's own aspect ratio fitted to max_size.
+    """
+    width, height = image.size
+    scale = max_size / max(width, height)
+    if scale < 1.0:
+        image.draft("RGB", (max(1, int(width * scale)), max(1, int(height * scale))))
 
 
 def resize_image(image: Image.Image, max_size: int, quality: int = 85) -> bytes:
     """Resize image to fit within max_size while preserving aspect ratio.
 
     Args:
-        image: PIL Image to resize.
+        image: PIL Image to resize. A JPEG that hasn't been loaded yet is
+            decoded at reduced scale in place.
         max_size: Maximum dimension (width or height).
         quality: JPEG quality (1-100).
 
     Returns:
         JPEG bytes of resized image.
     """
-    # Calculate new size preserving aspect ratio
+    # No-op unless image is a JPEG whose pixels haven't been decoded yet
+    _draft_to_fit(image, max_size)
+
+    # Calculate new size preserving aspect ratio (never upscale)
     width, height = image.size
-    if width > height:
-        if width > max_size:
-            new_width = max_size
-            new_height = int(height * max_size / width)
-        else:
-            new_width, new_height = width, height
-    else:
-        if height > max_size:
-            new_height = max_size
-            new_width = int(width * max_size / height)
-        else:
-            new_width, new_height = width, height
+    scale = min(1.0, max_size / max(width, height))
 
-    # Resize using high-quality resampling
-    resized = image.resize((new_width, new_height), Image.Resampling.LANCZOS)
+    if scale < 1.0:
+        # Resize using high-quality resampling
+        new_size = (max(1, round(width * scale)), max(1, round(height * scale)))
+        resized = image.resize(new_size, Image.Resampling.LANCZOS)
+    else:
+        # Already fits: re-encode as is instead of copying through resize()
+        resized = image
 
     # Convert to RGB if necessary (for JPEG output)
     if resized.mode in ("RGBA", "P"):
@@ -77,12 +154,15 @@ def create_thumbnail(image: Image.Image) -> bytes:
     """Create 100px square thumbnail with center crop. Prioritizes small file size.
 
     Args:
-        image: PIL Image to create thumbnail from.
+        image: PIL Image to create thumbnail from. A JPEG that hasn't been
+            loaded yet is decoded at reduced scale in place.
 
     Returns:
         JPEG bytes of 100x100 square thumbnail.
     """
-    size = 100
+    size = THUMBNAIL_SIZE
+    # No-op unless image is a JPEG whose pixels haven't been decoded yet
+    image.draft("RGB", (THUMBNAIL_DRAFT_SIZE, THUMBNAIL_DRAFT_SIZE))
     width, height = image.size
 
     # Calculate scaling to make shortest side = size
@@ -90,8 +170,8 @@ def create_thumbnail(image: Image.Image) -> bytes:
     new_width = int(width * scale)
     new_height = int(height * scale)
 
-    # Scale image
-    scaled = image.resize((new_width, new_height), Image.Resampling.LANCZOS)
+    # Scale image (bilinear is indistinguishable from Lanczos at this size)
+    scaled = image.resize((new_width, new_height), Image.Resampling.BILINEAR)
 
     # Calculate center crop coordinates
     left = (new_width - size) // 2
@@ -106,24 +186,148 @@ def create_thumbnail(image: Image.Image) -> bytes:
 
     # Save to bytes
     buffer = io.BytesIO()
-    thumbnail.save(buffer, format="JPEG", quality=60, optimize=True)
+    # No optimize=True: the extra Huffman pass costs more than it saves on a 100px image
+    thumbnail.save(buffer, format="JPEG", quality=THUMBNAIL_QUALITY)
     return buffer.getvalue()
 
 
+def _create_thumbnail_vips(source: Path | bytes) -> bytes:
+    """create_thumbnail with libvips, from a file or from encoded image bytes.
+
+    Shrink-on-load, EXIF rotation, the shortest-side scale and center crop
+    all happen in one pipeline.
+    """
+    if isinstance(source, bytes):
+        image = pyvips.Image.thumbnail_buffer(
+            source, THUMBNAIL_SIZE, height=THUMBNAIL_SIZE, crop="centre"
+        )
+    else:
+        image = pyvips.Image.thumbnail(
+            str(source), THUMBNAIL_SIZE, height=THUMBNAIL_SIZE, crop="centre"
+        )
+    return image.jpegsave_buffer(Q=THUMBNAIL_QUALITY, **_VIPS_STRIP)
+
+
+def create_thumbnail_from_file(file_path: Path) -> bytes:
+    """Create the 100px thumbnail straight from an image file.
+
+    Uses libvips when available, otherwise Pillow with orientation applied.
+
+    Args:
+        file_path: Path to the original image.
+
+    Returns:
+        JPEG bytes of 100x100 square thumbnail.
+    """
+    if pyvips is not None:
+        try:
+            return _create_thumbnail_vips(file_path)
+        except pyvips.Error:
+            pass  # Formats this libvips build can't load go through Pillow
+    with load_image_with_orientation(file_path, draft_size=THUMBNAIL_DRAFT_SIZE) as img:
+        return create_thumbnail(img)
+
+
 def create_default_view(image: Image.Image) -> bytes:
     """Create 2048px default view. Prioritizes quality."""
-    return resize_image(image, max_size=2048, quality=92)
+    return resize_image(image, max_size=DEFAULT_VIEW_SIZE, quality=DEFAULT_VIEW_QUALITY)
+
+
+def _create_default_view_vips(file_path: Path) -> bytes:
+    """Create the default view with libvips directly from the file.
+
+    Decode (with shrink-on-load), EXIF rotation, resize and encode run as one
+    streaming pipeline, so the full-size image is never held in memory.
+    """
+    image = pyvips.Image.thumbnail(
+        str(file_path), DEFAULT_VIEW_SIZE, height=DEFAULT_VIEW_SIZE, size="down"
+    )
+    return image.jpegsave_buffer(Q=DEFAULT_VIEW_QUALITY, optimize_coding=True, **_VIPS_STRIP)
+
+
+def create_default_view_from_file(file_path: Path) -> bytes:
+    """Create the 2048px default view straight from an image file.
 
+    Uses libvips when available, otherwise Pillow with orientation applied.
+
+    Args:
+        file_path: Path to the original image.
 
-def _convert_to_degrees(value) -> float | None:
-    """Convert EXIF GPS coordinates to decimal degrees."""
+    Returns:
+        JPEG bytes of the default view.
+    """
+    if pyvips is not None:
+        try:
+            return _create_default_view_vips(file_path)
+        except pyvips.Error:
+            pass  # Formats this libvips build can't load go through Pillow
+    with _open_image(file_path) as img:
+        # Must happen before orientation, which loads the pixels
+        _draft_to_fit(img, DEFAULT_VIEW_SIZE)
+        return create_default_view(apply_exif_orientation(img))
+
+
+def _rational_to_float(value) -> float:
+    """Convert an EXIF rational to float without going through IFDRational.__float__."""
+    if hasattr(value, "denominator"):
+        return value.numerator / value.denominator
+    return float(value)
+
+
+def _convert_to_degrees(value, ref=None) -> float | None:
+    """Convert EXIF GPS coordinates to signed decimal degrees.
+
+    Accepts the standard (degrees, minutes, seconds) triple as well as a single
+    value some devices write when the coordinate is already in decimal degrees.
+    A ref of "S" or "W" makes the result negative.
+    """
+    sign = -1.0 if ref in ("S", "W") else 1.0
     try:
         d, m, s = value
-        return float(d) + float(m) / 60 + float(s) / 3600
+    except (TypeError, ValueError):
+        # Not a DMS triple: treat as decimal degrees if it's numeric at all
+        try:
+            return sign * _rational_to_float(value)
+        except (TypeError, ValueError, ZeroDivisionError):
+            return None
+    try:
+        degrees = _rational_to_float(d)
+        minutes = _rational_to_float(m)
+        seconds = _rational_to_float(s)
+        return sign * (degrees + minutes * (1 / 60) + seconds * (1 / 3600))
+    except (TypeError, ValueError, ZeroDivisionError):
+        return None
+
+
+def _parse_exif_datetime(value: str) -> datetime | None:
+    """Parse an EXIF "YYYY:MM:DD HH:MM:SS" timestamp.
+
+    EXIF fixes the layout, so slicing is enough and much cheaper than strptime.
+    Blank or zeroed dates some cameras write parse as None.
+    """
+    try:
+        return datetime(
+            int(value[0:4]), int(value[5:7]), int(value[8:10]),
+            int(value[11:13]), int(value[14:16]), int(value[17:19]),
+        )
     except (TypeError, ValueError):
         return None
 
 
+_JSON_SCALARS = (str, int, float, bool, type(None))
+
+
+def _is_json_safe(value) -> bool:
+    """Check whether json.dumps would accept value, without encoding it."""
+    if isinstance(value, _JSON_SCALARS):
+        return True
+    if isinstance(value, (list, tuple)):
+        return all(_is_json_safe(v) for v in value)
+    if isinstance(value, dict):
+        return all(isinstance(k, _JSON_SCALARS) and _is_json_safe(v) for k, v in value.items())
+    return False
+
+
 def _format_rational(value) -> str | None:
     """Format an EXIF rational value as a string."""
     try:
@@ -136,128 +340,127 @@ def _format_rational(value) -> str | None:
         return None
 
 
-def extract_exif(file_path: Path) -> ExifData:
-    """Extract EXIF metadata from an image file.
+def _decode_exif(img: Image.Image) -> tuple[dict, dict]:
+    """Read EXIF tags from an open image.
 
-    Tries modern getexif() API first (works with HEIC), then falls back
-    to legacy _getexif() for older JPEG files if needed.
+    Uses Pillow's public getexif() API, which covers JPEG, HEIC and PNG. The
+    private _getexif() is built from the same data, so no fallback is needed.
 
     Args:
-        file_path: Path to the image file.
+        img: Open PIL Image.
+
+    Returns:
+        Tuple of (tags keyed by name, GPS IFD keyed by tag id).
+    """
+    exif = img.getexif()
+    if not exif:
+        return {}, {}
+
+    # Bind the lookup once rather than resolving TAGS.get for every tag
+    tag_name = TAGS.get
+
+    # Base EXIF, then the EXIF sub-IFD (exposure, lens, dates) on top
+    decoded = {tag_name(tag_id, tag_id): value for tag_id, value in exif.items()}
+    exif_ifd = exif.get_ifd(IFD.Exif)
+    decoded.update({tag_name(tag_id, tag_id): value for tag_id, value in exif_ifd.items()})
+
+    return decoded, exif.get_ifd(IFD.GPSInfo)
+
+
+def _exif_from_decoded(decoded: dict, gps_ifd: dict) -> ExifData:
+    """Build ExifData from decoded EXIF tags.
+
+    Args:
+        decoded: EXIF tags keyed by name.
+        gps_ifd: GPS IFD, keyed by tag id.
 
     Returns:
         ExifData with extracted metadata.
     """
     result = ExifData()
-    raw_exif: dict = {}
+
+    if not decoded:
+        return result
 
     try:
-        with Image.open(file_path) as img:
-            decoded = {}
-            gps_ifd = {}
-
-            # Try modern getexif() API first (works with HEIC, modern JPEG)
-            exif = img.getexif() if hasattr(img, 'getexif') else None
-            if exif:
-                # Get sub-IFDs for additional data
-                exif_ifd = exif.get_ifd(IFD.Exif) if hasattr(IFD, 'Exif') else {}
-                gps_ifd = exif.get_ifd(IFD.GPSInfo) if hasattr(IFD, 'GPSInfo') else {}
-
-                # Build decoded EXIF dict from base EXIF
-                for tag_id, value in exif.items():
-                    tag = TAGS.get(tag_id, tag_id)
-                    decoded[tag] = value
-
-                # Add EXIF IFD data
-                for tag_id, value in exif_ifd.items():
-                    tag = TAGS.get(tag_id, tag_id)
-                    decoded[tag] = value
-
-            # Fallback to legacy _getexif() if modern API didn't find data
-            if not decoded and hasattr(img, '_getexif'):
-                legacy_exif = img._getexif()
-                if legacy_exif:
-                    for tag_id, value in legacy_exif.items():
-                        tag = TAGS.get(tag_id, tag_id)
-                        decoded[tag] = value
-
-                    # Extract GPS from legacy format
-                    if "GPSInfo" in decoded and isinstance(decoded["GPSInfo"], dict):
-                        for tag_id, value in decoded["GPSInfo"].items():
-                            tag = GPSTAGS.get(tag_id, tag_id)
-                            gps_ifd[tag] = value
-
-            if not decoded:
-                return result
-
-            # Extract common fields
-            result.camera_make = decoded.get("Make")
-            result.camera_model = decoded.get("Model")
-            result.lens = decoded.get("LensModel")
-
-            # Focal length
-            if "FocalLength" in decoded:
-                fl = decoded["FocalLength"]
-                result.focal_length = f"{float(fl):.0f}mm" if fl else None
-
-            # Aperture (FNumber)
-            if "FNumber" in decoded:
-                fn = decoded["FNumber"]
-                result.aperture = f"f/{float(fn):.1f}" if fn else None
-
-            # Shutter speed (ExposureTime)
-            if "ExposureTime" in decoded:
-                et = decoded["ExposureTime"]
-                result.shutter_speed = _format_rational(et)
-                if result.shutter_speed and float(et) < 1:
-                    result.shutter_speed = f"1/{int(1/float(et))}"
-
-            # ISO
-            iso_val = decoded.get("ISOSpeedRatings") or decoded.get("PhotographicSensitivity")
-            if iso_val:
-                result.iso = int(iso_val) if iso_val else None
-
-            # Date taken
-            date_str = decoded.get("DateTimeOriginal") or decoded.get("DateTime")
-            if date_str:
-                try:
-                    result.taken_at = datetime.strptime(date_str, "%Y:%m:%d %H:%M:%S")
-                except ValueError:
-                    pass
-
-            # GPS coordinates - try numeric keys first (modern API), then string keys (legacy)
-            if gps_ifd:
-                lat_ref = gps_ifd.get(1) or gps_ifd.get("GPSLatitudeRef")
-                lat = gps_ifd.get(2) or gps_ifd.get("GPSLatitude")
-                lon_ref = gps_ifd.get(3) or gps_ifd.get("GPSLongitudeRef")
-                lon = gps_ifd.get(4) or gps_ifd.get("GPSLongitude")
-
-                if lat and lon:
-                    result.gps_lat = _convert_to_degrees(lat)
-                    result.gps_lon = _convert_to_degrees(lon)
-
-                    if result.gps_lat and lat_ref == "S":
-                        result.gps_lat = -result.gps_lat
-                    if result.gps_lon and lon_ref == "W":
-                        result.gps_lon = -result.gps_lon
-
-            # Store sanitized raw EXIF (convert non-serializable values)
-            for key, value in decoded.items():
-                if key == "GPSInfo":
-                    continue  # Skip binary GPS data
-                try:
-                    json.dumps(value)  # Test if serializable
-                    raw_exif[key] = value
-                except (TypeError, ValueError):
-                    raw_exif[key] = str(value)
-
-            result.raw_exif = raw_exif
+        # Extract common fields
+        result.camera_make = decoded.get("Make")
+        result.camera_model = decoded.get("Model")
+        result.lens = decoded.get("LensModel")
+
+        # Focal length
+        if "FocalLength" in decoded:
+            fl = decoded["FocalLength"]
+            result.focal_length = f"{float(fl):.0f}mm" if fl else None
+
+        # Aperture (FNumber)
+        if "FNumber" in decoded:
+            fn = decoded["FNumber"]
+            result.aperture = f"f/{float(fn):.1f}" if fn else None
+
+        # Shutter speed (ExposureTime)
+        if "ExposureTime" in decoded:
+            et = decoded["ExposureTime"]
+            result.shutter_speed = _format_rational(et)
+            if result.shutter_speed and float(et) < 1:
+                result.shutter_speed = f"1/{int(1/float(et))}"
+
+        # ISO
+        iso_val = decoded.get("ISOSpeedRatings") or decoded.get("PhotographicSensitivity")
+        if iso_val:
+            result.iso = int(iso_val) if iso_val else None
+
+        # Date taken
+        date_str = decoded.get("DateTimeOriginal") or decoded.get("DateTime")
+        if date_str:
+            result.taken_at = _parse_exif_datetime(date_str)
+
+        # GPS coordinates (GPSLatitudeRef, GPSLatitude, GPSLongitudeRef, GPSLongitude)
+        if gps_ifd:
+            lat_ref = gps_ifd.get(1)
+            lat = gps_ifd.get(2)
+            lon_ref = gps_ifd.get(3)
+            lon = gps_ifd.get(4)
+
+            if lat and lon:
+                result.gps_lat = _convert_to_degrees(lat, lat_ref)
+                result.gps_lon = _convert_to_degrees(lon, lon_ref)
+
+        # Keep the tags; the sanitized raw_exif is only built if something reads it
+        result.tags = decoded
+    except (TypeError, ValueError, ArithmeticError):
+        # A malformed value: keep whatever was extracted before it
+        pass
+
+    return result
 
+
+def _read_exif(img: Image.Image) -> ExifData:
+    """Extract EXIF metadata from an open image, returning empty data on failure."""
+    try:
+        decoded, gps_ifd = _decode_exif(img)
     except Exception:
         # Return empty result if EXIF extraction fails
-        pass
+        return ExifData()
+    return _exif_from_decoded(decoded, gps_ifd)
 
-    return result
+
+def extract_exif(file_path: Path) -> ExifData:
+    """Extract EXIF metadata from an image file.
+
+    Args:
+        file_path: Path to the image file.
+
+    Returns:
+        ExifData with extracted metadata.
+    """
+    try:
+        with _open_image(file_path) as img:
+            return _read_exif(img)
+    except (OSError, RuntimeError, ValueError):
+        # Return empty result if the file can't be opened: Pillow raises OSError (including
+        # UnidentifiedImageError), pillow-heif RuntimeError or ValueError for corrupt files
+        return ExifData()
 
 
 def get_image_dimensions(file_path: Path) -> tuple[int, int]:
@@ -269,9 +472,21 @@ def get_image_dimensions(file_path: Path) -> tuple[int, int]:
     Returns:
         Tuple of (width, height) in pixels.
     """
-    with Image.open(file_path) as img:
-        img = apply_exif_orientation(img)
-        return img.size
+    # Header only: a quarter turn swaps the sides, no need to decode and rotate the pixels
+    with _open_image(file_path) as img:
+        width, height = img.size
+        orientation = _exif_orientation(img)
+    if orientation in (5, 6, 7, 8):
+        return height, width
+    return width, height
+
+
+def _exif_orientation(img: Image.Image) -> int | None:
+    """Read the EXIF Orientation tag, or None if it's missing or the EXIF is unreadable."""
+    try:
+        return img.getexif().get(274)  # Orientation tag (Base.Orientation)
+    except Exception:
+        return None
 
 
 def apply_exif_orientation(img: Image.Image) -> Image.Image:
@@ -283,31 +498,27 @@ def apply_exif_orientation(img: Image.Image) -> Image.Image:
     Returns:
         Correctly oriented image.
     """
-    try:
-        exif = img.getexif()
-        if exif:
-            orientation = exif.get(274)  # Orientation tag (Base.Orientation)
-            if orientation == 3:
-                return img.rotate(180, expand=True)
-            elif orientation == 6:
-                return img.rotate(270, expand=True)
-            elif orientation == 8:
-                return img.rotate(90, expand=True)
-    except Exception:
-        pass
+    method = _ORIENTATION_TRANSPOSE.get(_exif_orientation(img))
+    if method is not None:
+        return img.transpose(method)
     return img
 
 
-def load_image_with_orientation(file_path: Path) -> Image.Image:
+def load_image_with_orientation(file_path: Path, draft_size: int | None = None) -> Image.Image:
     """Load an image and apply EXIF orientation.
 
     Args:
         file_path: Path to the image file.
+        draft_size: If set, JPEGs may be decoded at reduced scale as long as
+            both sides stay at least this large.
 
     Returns:
         Correctly oriented PIL Image.
     """
-    img = Image.open(file_path)
+    img = _open_image(file_path)
+    if draft_size:
+        # Must happen before orientation, which loads the full-size pixels
+        img.draft("RGB", (draft_size, draft_size))
     return apply_exif_orientation(img)
 
 
@@ -320,11 +531,29 @@ def process_image(file_path: Path) -> tuple[bytes, bytes, ExifData]:
     Returns:
         Tuple of (thumbnail_bytes, default_bytes, exif_data).
     """
-    exif = extract_exif(file_path)
-
-    with Image.open(file_path) as img:
-        img = apply_exif_orientation(img)
-        thumbnail = create_thumbnail(img)
-        default = create_default_view(img)
+    # One open serves both EXIF and pixels; orientation reuses the EXIF Pillow already parsed
+    with _open_image(file_path) as img:
+        exif = _read_exif(img)
+
+        default = None
+        if pyvips is not None:
+            try:
+                default = _create_default_view_vips(file_path)
+            except pyvips.Error:
+                pass  # Formats this libvips build can't load go through Pillow
+
+        if default is None:
+            _draft_to_fit(img, DEFAULT_VIEW_SIZE)
+            img = apply_exif_orientation(img)
+            default = create_default_view(img)
+
+    # Derive the thumbnail from the 2048px default view rather than the full-size original
+    if pyvips is not None:
+        thumbnail = _create_thumbnail_vips(default)
+    else:
+        with Image.open(io.BytesIO(default)) as default_img:
+            default_img.draft("RGB", (THUMBNAIL_DRAFT_SIZE, THUMBNAIL_DRAFT_SIZE))
+            thumbnail = create_thumbnail(default_img)
 
     return thumbnail, default, exif
+
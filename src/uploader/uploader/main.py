@@ -1,8 +1,13 @@
 """Main CLI entry point for the uploader."""
 
 import os
+import threading
+from collections import deque
+from collections.abc import Callable
+from concurrent.futures import Future, ThreadPoolExecutor
 from dataclasses import dataclass
 from datetime import datetime, timezone
+from itertools import islice
 from pathlib import Path
 from typing import TYPE_CHECKING
 from uuid import UUID
@@ -12,19 +17,22 @@ import click
 from .config import Config
 from .database import Database
 from .folder_metadata import get_folder_metadata, PlaceHint
-from .hash import compute_sha256
+from .hash import compute_sha256, compute_sha256_many, get_hash_cache
 from .image_processing import (
     ExifData,
-    create_default_view,
-    create_thumbnail,
+    create_default_view_from_file,
+    create_thumbnail_from_file,
     extract_exif,
     get_image_dimensions,
     load_image_with_orientation,
     process_image,
 )
-from .storage import BlobStorage
+from .storage import UPLOAD_MAX_CONCURRENCY, BlobStorage
 
 if TYPE_CHECKING:
+    import torch
+    from PIL import Image
+
     from .embeddings import DINOv2Embedder
     from .faces import FaceDetector
     from .folder_metadata import FolderMetadata
@@ -36,8 +44,18 @@ EXTENSIONS_DEFAULT = ".jpg,.jpeg,.png,.heic,.heif"
 
 def find_image_files(directory: Path, extensions: str = EXTENSIONS_DEFAULT) -> list[Path]:
     """Find all image files in a directory recursively."""
-    ext_list = [e.strip().lower() for e in extensions.split(",")]
-    return sorted(f for f in directory.rglob("*") if f.suffix.lower() in ext_list)
+    ext_set = frozenset(e.strip().lower() for e in extensions.split(","))
+    found = []
+    # Walk with scandir and plain strings; only matching files become Path objects
+    stack = [os.fspath(directory)]
+    while stack:
+        with os.scandir(stack.pop()) as entries:
+            for entry in entries:
+                if entry.is_dir(follow_symlinks=False):
+                    stack.append(entry.path)
+                elif os.path.splitext(entry.name)[1].lower() in ext_set:
+                    found.append(Path(entry.path))
+    return sorted(found)
 
 
 @dataclass
@@ -58,6 +76,9 @@ class ProcessingContext:
     existing_photo_ids: set[str] | None = None
     existing_embeddings: set[str] | None = None
     existing_photo_places: dict[str, "UUID"] | None = None
+    manual_edits: dict[str, set[str]] | None = None
+    # Background blob uploads (overlap network I/O with model inference)
+    upload_executor: ThreadPoolExecutor | None = None
     # Folder metadata cache to avoid redundant filesystem walks
     folder_metadata_cache: dict[Path, "FolderMetadata"] | None = None
 
@@ -167,10 +188,89 @@ def get_place_id_for_photo(
     return None, "none"
 
 
+def _start_upload(ctx: ProcessingContext, upload: Callable[..., str], *args) -> Future:
+    """Run a blob upload on the context's upload executor, or inline if there is none."""
+    if ctx.upload_executor is not None:
+        return ctx.upload_executor.submit(upload, *args)
+    future: Future = Future()
+    future.set_result(upload(*args))
+    return future
+
+
+class _LazyModel:
+    """Stands in for a model and loads it on first attribute access.
+
+    Thread-safe, so concurrent batch workers trigger exactly one load.
+    """
+
+    def __init__(self, name: str, load: Callable[[], object]):
+        self._name = name
+        self._load = load
+        self._model = None
+        self._lock = threading.Lock()
+
+    def __getattr__(self, attr: str):
+        if self._model is None:
+            with self._lock:
+                if self._model is None:
+                    click.echo(f"Loading {self._name} model...")
+                    self._model = self._load()
+        return getattr(self._model, attr)
+
+
+def _load_embedder() -> "DINOv2Embedder":
+    from .embeddings import get_embedder
+    return get_embedder()
+
+
+def _load_detector() -> "FaceDetector":
+    from .faces import get_detector
+    return get_detector()
+
+
+def _load_embedding_input(embedder: "DINOv2Embedder", file_path: Path) -> "Image.Image":
+    """Decode a photo for the embedder, the same way in every command.
+
+    JPEGs decode at reduced scale down to the size the preprocessor resizes to
+    anyway, so an embedding doesn't depend on which command generated it.
+    """
+    return load_image_with_orientation(file_path, draft_size=embedder.min_input_size)
+
+
+class _HashPrefetcher:
+    """Hashes files a bounded distance ahead of the ones being processed.
+
+    Reads for upcoming photos overlap with work on the current ones, while the
+    window stays small enough that each file is still in the page cache when
+    it is read again for processing.
+    """
+
+    def __init__(self, files: list[Path], executor: ThreadPoolExecutor, lookahead: int):
+        self._files = files
+        self._executor = executor
+        self._lookahead = lookahead
+        self._futures: dict[int, Future] = {}
+        self._next = 0
+        self._lock = threading.Lock()
+
+    def get(self, index: int) -> str:
+        """Return the hash of files[index], queueing hashes up to the lookahead window."""
+        with self._lock:
+            end = min(index + self._lookahead + 1, len(self._files))
+            while self._next < end:
+                self._futures[self._next] = self._executor.submit(
+                    get_hash_cache().compute, self._files[self._next]
+                )
+                self._next += 1
+            future = self._futures.pop(index)
+        return future.result()
+
+
 def process_photo(
     ctx: ProcessingContext,
     file_path: Path,
     folder_yaml_root: Path | None = None,
+    photo_id: str | None = None,
 ) -> str:
     """Process a single photo with full pipeline.
 
@@ -178,6 +278,7 @@ def process_photo(
         ctx: Processing context with models and connections.
         file_path: Path to the photo file.
         folder_yaml_root: Optional root directory for folder.yaml inheritance.
+        photo_id: SHA-256 of the file, if the caller already computed it.
 
     Returns:
         Photo ID (SHA-256 hash).
@@ -185,7 +286,8 @@ def process_photo(
     verbose = ctx.verbose
 
     # Compute hash first (needed for all checks)
-    photo_id = compute_sha256(file_path)
+    if photo_id is None:
+        photo_id = compute_sha256(file_path)
     if verbose:
         click.echo(f"  Hash: {photo_id[:12]}...")
 
@@ -249,22 +351,19 @@ def process_photo(
         else:
             click.echo(f"  Date: {date_earlier.date()} to {date_later.date()} (from {date_source})")
 
-    # Upload blobs (skip individually if already exist)
+    # Upload blobs (skip individually if already exist). With an upload executor these
+    # run in the background while dimensions, embeddings and faces are computed.
+    # Each entry pairs the upload with the pre-fetched set to update once it completes.
+    uploads: list[tuple[Future, set[str] | None]] = []
     if not has_original:
-        ctx.storage.upload_original(file_path, photo_id)
-        # Update pre-fetched set if present
-        if ctx.existing_originals is not None:
-            ctx.existing_originals.add(photo_id)
+        uploads.append((_start_upload(ctx, ctx.storage.upload_original, file_path, photo_id),
+                        ctx.existing_originals))
     if not has_thumbnail and thumbnail is not None:
-        ctx.storage.upload_thumbnail(photo_id, thumbnail)
-        # Update pre-fetched set if present
-        if ctx.existing_thumbnails is not None:
-            ctx.existing_thumbnails.add(photo_id)
+        uploads.append((_start_upload(ctx, ctx.storage.upload_thumbnail, photo_id, thumbnail),
+                        ctx.existing_thumbnails))
     if not has_default and default_view is not None:
-        ctx.storage.upload_default(photo_id, default_view)
-        # Update pre-fetched set if present
-        if ctx.existing_defaults is not None:
-            ctx.existing_defaults.add(photo_id)
+        uploads.append((_start_upload(ctx, ctx.storage.upload_default, photo_id, default_view),
+                        ctx.existing_defaults))
 
     if verbose and (has_original or has_thumbnail or has_default):
         click.echo(f"  Blobs: original={'skip' if has_original else 'upload'}, "
@@ -309,22 +408,9 @@ def process_photo(
     # Get original image dimensions (after orientation correction)
     img_width, img_height = get_image_dimensions(file_path)
 
-    # Create/update photo record (respects manual edits via has_manual_edits check)
-    ctx.db.create_photo(
-        photo_id=photo_id,
-        original_filename=file_path.name,
-        date_not_earlier_than=date_earlier,
-        date_not_later_than=date_later,
-        place_id=place_id,
-        width=img_width,
-        height=img_height,
-    )
-
-    # Create EXIF record
-    if exif.camera_make or exif.taken_at:
-        ctx.db.create_exif_metadata(photo_id, exif)
-
     # Generate embedding if enabled
+    embedding = None
+    needs_embedding = False
     if ctx.embedder:
         # Use pre-fetched set if available, otherwise query database
         if ctx.existing_embeddings is not None:
@@ -336,16 +422,11 @@ def process_photo(
             if verbose:
                 click.echo("  Embedding: exists, skipping")
         else:
-            with load_image_with_orientation(file_path) as img:
-                embedding = ctx.embedder.generate(img)
-            ctx.db.create_image_embedding(photo_id, embedding)
-            if verbose:
-                click.echo("  Embedding: generated")
-            # Update pre-fetched set if present
-            if ctx.existing_embeddings is not None:
-                ctx.existing_embeddings.add(photo_id)
+            needs_embedding = True
 
     # Detect faces if enabled
+    faces = None
+    needs_faces = False
     if ctx.face_detector:
         # Check if face detection has already been run on this photo
         # We track this by checking if the photo exists in the database (since face detection
@@ -362,19 +443,56 @@ def process_photo(
             if verbose:
                 click.echo(f"  Faces: exist, skipping")
         else:
-            with load_image_with_orientation(file_path) as img:
-                faces = ctx.face_detector.detect(img)
-            for face in faces:
-                ctx.db.create_face(
-                    photo_id=photo_id,
-                    bbox_x=face.bbox_x,
-                    bbox_y=face.bbox_y,
-                    bbox_width=face.bbox_width,
-                    bbox_height=face.bbox_height,
-                    embedding=face.embedding,
-                )
-            if verbose:
-                click.echo(f"  Faces: {len(faces)} detected")
+            needs_faces = True
+
+    if needs_embedding:
+        with _load_embedding_input(ctx.embedder, file_path) as img:
+            embedding = ctx.embedder.generate(img)
+    if needs_faces:
+        # Face boxes are in original pixels, so detection gets the full-size decode
+        with load_image_with_orientation(file_path) as img:
+            faces = ctx.face_detector.detect(img)
+
+    # Blobs must be in place before the photo record points at them
+    for upload, existing in uploads:
+        upload.result()
+        # Update pre-fetched set if present
+        if existing is not None:
+            existing.add(photo_id)
+
+    # Write all records for this photo in one pipelined round-trip
+    with ctx.db.pipeline():
+        # Create/update photo record (respects manual edits via has_manual_edits check)
+        ctx.db.create_photo(
+            photo_id=photo_id,
+            original_filename=file_path.name,
+            date_not_earlier_than=date_earlier,
+            date_not_later_than=date_later,
+            place_id=place_id,
+            width=img_width,
+            height=img_height,
+            manual_edits=ctx.manual_edits,
+        )
+
+        # Create EXIF record
+        if exif.camera_make or exif.taken_at:
+            ctx.db.create_exif_metadata(photo_id, exif)
+
+        if embedding is not None:
+            ctx.db.create_image_embedding(photo_id, embedding)
+
+    if embedding is not None:
+        if verbose:
+            click.echo("  Embedding: generated")
+        # Update pre-fetched set if present
+        if ctx.existing_embeddings is not None:
+            ctx.existing_embeddings.add(photo_id)
+
+    # Faces are streamed with COPY, which can't run inside the pipeline
+    if faces is not None:
+        ctx.db.create_faces_bulk(photo_id, faces)
+        if verbose:
+            click.echo(f"  Faces: {len(faces)} detected")
 
     return photo_id
 
@@ -435,7 +553,12 @@ def upload(file_path: Path, root: Path | None, verbose: bool, no_embeddings: boo
             verbose=True,  # Always verbose for single upload
         )
 
-        photo_id = process_photo(ctx, file_path, root)
+        try:
+            photo_id = process_photo(ctx, file_path, root)
+            db.commit()
+        except Exception:
+            db.rollback()
+            raise
 
     click.echo(f"  Photo ID: {photo_id}")
 
@@ -447,36 +570,33 @@ def upload(file_path: Path, root: Path | None, verbose: bool, no_embeddings: boo
 @click.option("--no-embeddings", is_flag=True, help="Skip DINOv2 similarity embeddings")
 @click.option("--no-faces", is_flag=True, help="Skip face detection")
 @click.option("--no-geocoding", is_flag=True, help="Skip GPS reverse geocoding")
-def batch(directory: Path, extensions: str, verbose: bool, no_embeddings: bool, no_faces: bool, no_geocoding: bool):
+@click.option("--workers", default=1, type=click.IntRange(min=1),
+              help="Photos processed concurrently (overlaps database, upload and model work)")
+def batch(directory: Path, extensions: str, verbose: bool, no_embeddings: bool, no_faces: bool,
+          no_geocoding: bool, workers: int):
     """Upload all photos in a directory with full processing.
 
     DIRECTORY: Path to directory containing photos.
     """
     config = Config()
-    ext_list = [e.strip().lower() for e in extensions.split(",")]
 
     # Find all matching files
-    files = sorted([f for f in directory.rglob("*") if f.suffix.lower() in ext_list])
+    files = find_image_files(directory, extensions)
     click.echo(f"Found {len(files)} files to process")
 
     # Load models once (expensive)
+    # Models load when the first photo needs them, so a fully processed batch never loads them
     embedder = None
     if no_embeddings:
         click.echo("Embeddings: disabled (--no-embeddings)")
     else:
-        click.echo("Loading DINOv2 model...", nl=False)
-        from .embeddings import get_embedder
-        embedder = get_embedder()
-        click.echo(" done.")
+        embedder = _LazyModel("DINOv2", _load_embedder)
 
     face_detector = None
     if no_faces:
         click.echo("Faces: disabled (--no-faces)")
     else:
-        click.echo("Loading InsightFace model...", nl=False)
-        from .faces import get_detector
-        face_detector = get_detector()
-        click.echo(" done.")
+        face_detector = _LazyModel("InsightFace", _load_detector)
 
     geocoder = None
     if no_geocoding:
@@ -485,21 +605,29 @@ def batch(directory: Path, extensions: str, verbose: bool, no_embeddings: bool,
         from .geocoding import get_geocoder
         geocoder = get_geocoder()
 
-    storage = BlobStorage(config.storage_account_name)
-    processed = 0
-    errors = 0
+    # Each worker waits for its own uploads, so at most one original per worker is in flight,
+    # split into up to UPLOAD_MAX_CONCURRENCY block requests, next to a thumbnail and a default
+    storage = BlobStorage(config.storage_account_name,
+                          max_connections=workers * (UPLOAD_MAX_CONCURRENCY + 2))
 
-    with Database(config.postgres_host, config.postgres_database, config.postgres_user) as db:
+    # One pooled connection per worker, plus one for the pre-fetch queries
+    with Database(config.postgres_host, config.postgres_database, config.postgres_user,
+                  max_connections=workers + 1) as db:
         # Pre-fetch existence data for batch optimization
         click.echo("Pre-fetching existing data for fast resume...", nl=False)
         existing_originals = storage.list_all_blobs("originals")
         existing_thumbnails = storage.list_all_blobs("thumbnails")
         existing_defaults = storage.list_all_blobs("default")
-        existing_photo_ids = db.get_all_photo_ids()
-        existing_embeddings = db.get_all_embedding_photo_ids() if not no_embeddings else None
-        existing_photo_places = db.get_all_photo_places() if not no_geocoding else None
+        index = db.load_startup_index(embeddings=not no_embeddings, faces=False)
+        existing_photo_ids = index.photo_ids
+        existing_embeddings = index.embedding_photo_ids if not no_embeddings else None
+        existing_photo_places = index.photo_places if not no_geocoding else None
+        manual_edits = index.manual_edits
         click.echo(f" done. ({len(existing_photo_ids)} photos, {len(existing_originals)} originals)")
 
+        # Up to three blob uploads (original, thumbnail, default) in flight per worker
+        upload_executor = ThreadPoolExecutor(max_workers=3 * workers)
+
         ctx = ProcessingContext(
             config=config,
             storage=storage,
@@ -514,19 +642,36 @@ def batch(directory: Path, extensions: str, verbose: bool, no_embeddings: bool,
             existing_photo_ids=existing_photo_ids,
             existing_embeddings=existing_embeddings,
             existing_photo_places=existing_photo_places,
+            manual_edits=manual_edits,
             folder_metadata_cache={},  # Enable caching for batch processing
+            upload_executor=upload_executor,
         )
 
-        for i, file_path in enumerate(files, 1):
+        # Hash upcoming files while workers process the current ones
+        hash_executor = ThreadPoolExecutor(max_workers=workers)
+        hashes = _HashPrefetcher(files, hash_executor, lookahead=2 * workers)
+
+        def process_one(i: int, file_path: Path) -> bool:
             click.echo(f"[{i}/{len(files)}] {file_path.relative_to(directory)}")
 
             try:
-                photo_id = process_photo(ctx, file_path, folder_yaml_root=None)
+                photo_id = process_photo(ctx, file_path, folder_yaml_root=None,
+                                         photo_id=hashes.get(i - 1))
+                # One commit per photo so all its rows land together
+                db.commit()
                 click.echo(f"  Processed: {photo_id[:12]}...")
-                processed += 1
+                return True
             except Exception as e:
+                db.rollback()
                 click.echo(f"  Error: {e}", err=True)
-                errors += 1
+                return False
+
+        with upload_executor, hash_executor, ThreadPoolExecutor(max_workers=workers) as executor:
+            results = list(executor.map(process_one, range(1, len(files) + 1), files))
+        get_hash_cache().save()
+
+        processed = sum(results)
+        errors = len(results) - processed
 
     click.echo(f"\nDone! Processed: {processed}, Errors: {errors}")
 
@@ -540,46 +685,23 @@ def cluster(threshold: float, min_samples: int):
     Groups similar faces together using DBSCAN clustering on face embeddings.
     Results are stored in the cluster_id field of the faces table.
     """
-    import numpy as np
-    from sklearn.cluster import DBSCAN
+    from .clustering import cluster_embeddings
 
     config = Config()
 
     click.echo("Loading face embeddings from database...")
 
     with Database(config.postgres_host, config.postgres_database, config.postgres_user) as db:
-        face_data = db.get_all_face_embeddings()
+        face_ids, embeddings = db.get_all_face_embeddings()
 
-        if not face_data:
+        if not face_ids:
             click.echo("No faces found in database.")
             return
 
-        click.echo(f"Found {len(face_data)} faces")
-
-        # Extract face IDs and embeddings
-        face_ids = [f[0] for f in face_data]
-        embeddings = np.array([f[1] for f in face_data])
-
-        # Normalize embeddings for cosine distance
-        norms = np.linalg.norm(embeddings, axis=1, keepdims=True)
-        embeddings_normalized = embeddings / norms
+        click.echo(f"Found {len(face_ids)} faces")
 
         click.echo(f"Running DBSCAN clustering (threshold={threshold}, min_samples={min_samples})...")
-
-        # DBSCAN with cosine distance (via precomputed distance matrix)
-        # For normalized vectors, cosine distance = 1 - cosine similarity
-        # And cosine similarity = dot product for normalized vectors
-        similarity_matrix = np.dot(embeddings_normalized, embeddings_normalized.T)
-        # Clip to handle floating-point precision issues (similarity slightly > 1)
-        distance_matrix = np.clip(1 - similarity_matrix, 0, 2)
-
-        clustering = DBSCAN(
-            eps=threshold,
-            min_samples=min_samples,
-            metric="precomputed",
-        ).fit(distance_matrix)
-
-        labels = clustering.labels_
+        labels = cluster_embeddings(embeddings, threshold, min_samples)
 
         # Count clusters (excluding noise label -1)
         n_clusters = len(set(labels)) - (1 if -1 in labels else 0)
@@ -589,13 +711,16 @@ def cluster(threshold: float, min_samples: int):
 
         # Update cluster_id for each face
         click.echo("Updating database...", nl=False)
-        for face_id, label in zip(face_ids, labels):
-            if label != -1:
-                db.update_face_cluster(face_id, f"cluster_{label}")
+        db.update_face_clusters_batch([
+            (face_id, f"cluster_{label}")
+            for face_id, label in zip(face_ids, labels)
+            if label != -1
+        ])
+        db.commit()
         click.echo(" done.")
 
         click.echo(f"\nClustering complete!")
-        click.echo(f"  Total faces: {len(face_data)}")
+        click.echo(f"  Total faces: {len(face_ids)}")
         click.echo(f"  Clusters: {n_clusters}")
         click.echo(f"  Unclustered: {n_noise}")
 
@@ -619,9 +744,10 @@ def check(verbose: bool):
 
     with Database(config.postgres_host, config.postgres_database, config.postgres_user) as db:
         click.echo("Fetching database records...", nl=False)
-        db_photos = db.get_all_photo_ids()
-        db_embeddings = db.get_all_embedding_photo_ids()
-        db_places = db.get_all_photo_places()
+        index = db.load_startup_index(faces=False)
+        db_photos = index.photo_ids
+        db_embeddings = index.embedding_photo_ids
+        db_places = index.photo_places
         click.echo(" done.")
 
         # Pre-compute discrepancy sets while DB is open
@@ -692,131 +818,115 @@ def check(verbose: bool):
         click.echo(f"Found {issues} total discrepancies.")
 
 
+def _upload_missing(
+    directory: Path,
+    files: list[Path],
+    photo_ids: list[str],
+    existing: set[str],
+    upload: Callable[[Path, str], object],
+    verbose: bool,
+    workers: int,
+) -> None:
+    """Run upload(file_path, photo_id) for every file not yet in existing.
+
+    Used by the single-blob stage commands. Files are rendered and uploaded
+    workers at a time, since each one mostly waits on the network.
+    """
+    def upload_one(i: int, file_path: Path, photo_id: str) -> str:
+        if photo_id in existing:
+            if verbose:
+                click.echo(f"[{i}/{len(files)}] {file_path.relative_to(directory)} - skip")
+            return "skipped"
+
+        try:
+            click.echo(f"[{i}/{len(files)}] {file_path.relative_to(directory)}")
+            upload(file_path, photo_id)
+            existing.add(photo_id)
+            return "uploaded"
+        except Exception as e:
+            click.echo(f"  Error: {e}", err=True)
+            return "error"
+
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        results = list(executor.map(upload_one, range(1, len(files) + 1), files, photo_ids))
+
+    click.echo(f"\nDone! Uploaded: {results.count('uploaded')}, "
+               f"Skipped: {results.count('skipped')}, Errors: {results.count('error')}")
+
+
 @cli.command()
 @click.argument("directory", type=click.Path(exists=True, file_okay=False, path_type=Path))
 @click.option("--extensions", default=EXTENSIONS_DEFAULT, help="Comma-separated file extensions")
 @click.option("--verbose", "-v", is_flag=True, help="Show detailed processing information")
-def originals(directory: Path, extensions: str, verbose: bool):
+@click.option("--workers", default=1, type=click.IntRange(min=1),
+              help="Files rendered and uploaded concurrently")
+def originals(directory: Path, extensions: str, verbose: bool, workers: int):
     """Upload original photos to blob storage."""
     config = Config()
     files = find_image_files(directory, extensions)
     click.echo(f"Found {len(files)} files")
 
-    storage = BlobStorage(config.storage_account_name)
+    # Each upload splits into up to UPLOAD_MAX_CONCURRENCY parallel block requests
+    storage = BlobStorage(config.storage_account_name,
+                          max_connections=workers * UPLOAD_MAX_CONCURRENCY)
 
     click.echo("Fetching existing originals...", nl=False)
     existing = storage.list_all_blobs("originals")
     click.echo(f" {len(existing)} already uploaded")
 
-    uploaded = 0
-    skipped = 0
-    errors = 0
-
-    for i, file_path in enumerate(files, 1):
-        photo_id = compute_sha256(file_path)
-
-        if photo_id in existing:
-            skipped += 1
-            if verbose:
-                click.echo(f"[{i}/{len(files)}] {file_path.relative_to(directory)} - skip")
-            continue
-
-        try:
-            click.echo(f"[{i}/{len(files)}] {file_path.relative_to(directory)}")
-            storage.upload_original(file_path, photo_id)
-            existing.add(photo_id)
-            uploaded += 1
-        except Exception as e:
-            click.echo(f"  Error: {e}", err=True)
-            errors += 1
-
-    click.echo(f"\nDone! Uploaded: {uploaded}, Skipped: {skipped}, Errors: {errors}")
+    photo_ids = compute_sha256_many(files)
+    _upload_missing(directory, files, photo_ids, existing, storage.upload_original,
+                    verbose, workers)
 
 
 @cli.command()
 @click.argument("directory", type=click.Path(exists=True, file_okay=False, path_type=Path))
 @click.option("--extensions", default=EXTENSIONS_DEFAULT, help="Comma-separated file extensions")
 @click.option("--verbose", "-v", is_flag=True, help="Show detailed processing information")
-def thumbnails(directory: Path, extensions: str, verbose: bool):
+@click.option("--workers", default=1, type=click.IntRange(min=1),
+              help="Files rendered and uploaded concurrently")
+def thumbnails(directory: Path, extensions: str, verbose: bool, workers: int):
     """Generate and upload photo thumbnails (100px square crops)."""
     config = Config()
     files = find_image_files(directory, extensions)
     click.echo(f"Found {len(files)} files")
 
-    storage = BlobStorage(config.storage_account_name)
+    storage = BlobStorage(config.storage_account_name, max_connections=workers)
 
     click.echo("Fetching existing thumbnails...", nl=False)
     existing = storage.list_all_blobs("thumbnails")
     click.echo(f" {len(existing)} already uploaded")
 
-    uploaded = 0
-    skipped = 0
-    errors = 0
-
-    for i, file_path in enumerate(files, 1):
-        photo_id = compute_sha256(file_path)
-
-        if photo_id in existing:
-            skipped += 1
-            if verbose:
-                click.echo(f"[{i}/{len(files)}] {file_path.relative_to(directory)} - skip")
-            continue
-
-        try:
-            click.echo(f"[{i}/{len(files)}] {file_path.relative_to(directory)}")
-            with load_image_with_orientation(file_path) as img:
-                data = create_thumbnail(img)
-            storage.upload_thumbnail(photo_id, data)
-            existing.add(photo_id)
-            uploaded += 1
-        except Exception as e:
-            click.echo(f"  Error: {e}", err=True)
-            errors += 1
+    def upload(file_path: Path, photo_id: str) -> None:
+        storage.upload_thumbnail(photo_id, create_thumbnail_from_file(file_path))
 
-    click.echo(f"\nDone! Uploaded: {uploaded}, Skipped: {skipped}, Errors: {errors}")
+    photo_ids = compute_sha256_many(files)
+    _upload_missing(directory, files, photo_ids, existing, upload, verbose, workers)
 
 
 @cli.command()
 @click.argument("directory", type=click.Path(exists=True, file_okay=False, path_type=Path))
 @click.option("--extensions", default=EXTENSIONS_DEFAULT, help="Comma-separated file extensions")
 @click.option("--verbose", "-v", is_flag=True, help="Show detailed processing information")
-def defaults(directory: Path, extensions: str, verbose: bool):
+@click.option("--workers", default=1, type=click.IntRange(min=1),
+              help="Files rendered and uploaded concurrently")
+def defaults(directory: Path, extensions: str, verbose: bool, workers: int):
     """Generate and upload default view images (2048px)."""
     config = Config()
     files = find_image_files(directory, extensions)
     click.echo(f"Found {len(files)} files")
 
-    storage = BlobStorage(config.storage_account_name)
+    storage = BlobStorage(config.storage_account_name, max_connections=workers)
 
     click.echo("Fetching existing defaults...", nl=False)
     existing = storage.list_all_blobs("default")
     click.echo(f" {len(existing)} already uploaded")
 
-    uploaded = 0
-    skipped = 0
-    errors = 0
+    def upload(file_path: Path, photo_id: str) -> None:
+        storage.upload_default(photo_id, create_default_view_from_file(file_path))
 
-    for i, file_path in enumerate(files, 1):
-        photo_id = compute_sha256(file_path)
-
-        if photo_id in existing:
-            skipped += 1
-            if verbose:
-                click.echo(f"[{i}/{len(files)}] {file_path.relative_to(directory)} - skip")
-            continue
-
-        try:
-            click.echo(f"[{i}/{len(files)}] {file_path.relative_to(directory)}")
-            with load_image_with_orientation(file_path) as img:
-                data = create_default_view(img)
-            storage.upload_default(photo_id, data)
-            existing.add(photo_id)
-            uploaded += 1
-        except Exception as e:
-            click.echo(f"  Error: {e}", err=True)
-            errors += 1
-
-    click.echo(f"\nDone! Uploaded: {uploaded}, Skipped: {skipped}, Errors: {errors}")
+    photo_ids = compute_sha256_many(files)
+    _upload_missing(directory, files, photo_ids, existing, upload, verbose, workers)
 
 
 @cli.command()
@@ -826,29 +936,33 @@ def defaults(directory: Path, extensions: str, verbose: bool):
 @click.option("--extensions", default=EXTENSIONS_DEFAULT, help="Comma-separated file extensions")
 @click.option("--verbose", "-v", is_flag=True, help="Show detailed processing information")
 @click.option("--force", "-f", is_flag=True, help="Force update of existing records")
-def metadata(directory: Path, root: Path | None, extensions: str, verbose: bool, force: bool):
+@click.option("--workers", default=1, type=click.IntRange(min=1),
+              help="Files read and written concurrently")
+def metadata(directory: Path, root: Path | None, extensions: str, verbose: bool, force: bool,
+             workers: int):
     """Create photo and EXIF database records. Uses folder.yaml, EXIF, or file dates."""
     config = Config()
     files = find_image_files(directory, extensions)
     click.echo(f"Found {len(files)} files")
 
-    with Database(config.postgres_host, config.postgres_database, config.postgres_user) as db:
+    # One pooled connection per worker (each commits its own photos), plus one for the index
+    with Database(config.postgres_host, config.postgres_database, config.postgres_user,
+                  max_connections=workers + 1) as db:
         click.echo("Fetching existing photo records...", nl=False)
-        existing = db.get_all_photo_ids()
+        index = db.load_startup_index(embeddings=False, faces=False)
+        existing = index.photo_ids
+        manual_edits = index.manual_edits
         click.echo(f" {len(existing)} already in database")
 
-        created = 0
-        skipped = 0
         folder_cache: dict[Path, object] = {}
 
-        for i, file_path in enumerate(files, 1):
-            photo_id = compute_sha256(file_path)
+        photo_ids = compute_sha256_many(files)
 
+        def create_one(i: int, file_path: Path, photo_id: str) -> bool:
             if photo_id in existing and not force:
-                skipped += 1
                 if verbose:
                     click.echo(f"[{i}/{len(files)}] {file_path.relative_to(directory)} - skip")
-                continue
+                return False
 
             try:
                 click.echo(f"[{i}/{len(files)}] {file_path.relative_to(directory)}")
@@ -874,24 +988,33 @@ def metadata(directory: Path, root: Path | None, extensions: str, verbose: bool,
 
                 img_width, img_height = get_image_dimensions(file_path)
 
-                db.create_photo(
-                    photo_id=photo_id,
-                    original_filename=file_path.name,
-                    date_not_earlier_than=date_earlier,
-                    date_not_later_than=date_later,
-                    width=img_width,
-                    height=img_height,
-                )
+                with db.pipeline():
+                    db.create_photo(
+                        photo_id=photo_id,
+                        original_filename=file_path.name,
+                        date_not_earlier_than=date_earlier,
+                        date_not_later_than=date_later,
+                        width=img_width,
+                        height=img_height,
+                        manual_edits=manual_edits,
+                    )
 
-                if exif.camera_make or exif.taken_at:
-                    db.create_exif_metadata(photo_id, exif)
+                    if exif.camera_make or exif.taken_at:
+                        db.create_exif_metadata(photo_id, exif)
+                db.commit()
 
                 existing.add(photo_id)
-                created += 1
+                return True
             except Exception as e:
+                db.rollback()
                 click.echo(f"  Error: {e}", err=True)
                 raise
 
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            results = list(executor.map(create_one, range(1, len(files) + 1), files, photo_ids))
+        created = sum(results)
+        skipped = len(results) - created
+
     click.echo(f"\nDone! Created: {created}, Skipped: {skipped}")
 
 
@@ -920,8 +1043,10 @@ def places(directory: Path, root: Path | None, extensions: str, verbose: bool, n
 
     with Database(config.postgres_host, config.postgres_database, config.postgres_user) as db:
         click.echo("Fetching existing data...", nl=False)
-        existing_photo_ids = db.get_all_photo_ids()
-        existing_places = db.get_all_photo_places()
+        index = db.load_startup_index(embeddings=False, faces=False)
+        existing_photo_ids = index.photo_ids
+        existing_places = index.photo_places
+        manual_edits = index.manual_edits
         click.echo(f" {len(existing_places)} photos already have places")
 
         resolved = 0
@@ -930,10 +1055,12 @@ def places(directory: Path, root: Path | None, extensions: str, verbose: bool, n
         no_data = 0
         errors = 0
         folder_cache: dict[Path, object] = {}
+        pending = []
 
-        for i, file_path in enumerate(files, 1):
-            photo_id = compute_sha256(file_path)
+        photo_ids = compute_sha256_many(files)
 
+        # First pass: find photos needing a place and read their location data
+        for i, (file_path, photo_id) in enumerate(zip(files, photo_ids), 1):
             if photo_id not in existing_photo_ids:
                 not_in_db += 1
                 if verbose:
@@ -954,7 +1081,32 @@ def places(directory: Path, root: Path | None, extensions: str, verbose: bool, n
                     folder_meta = get_folder_metadata(file_path, root, verbose=verbose)
                     folder_cache[parent_dir] = folder_meta
 
-                exif = extract_exif(file_path)
+                # EXIF only matters for its GPS, which is unused when folder.yaml names the place
+                # or geocoding is off
+                if geocoder and not (folder_meta.place and folder_meta.place.has_hierarchy):
+                    exif = extract_exif(file_path)
+                else:
+                    exif = ExifData()
+                pending.append((i, file_path, photo_id, folder_meta, exif))
+            except Exception as e:
+                click.echo(f"  Error: {e}", err=True)
+                errors += 1
+
+        # Geocode each distinct location once, so the loop below only hits the cache
+        if geocoder:
+            coords = [
+                (exif.gps_lat, exif.gps_lon)
+                for _, _, _, folder_meta, exif in pending
+                if not (folder_meta.place and folder_meta.place.has_hierarchy)
+                and exif.gps_lat is not None and exif.gps_lon is not None
+            ]
+            if coords:
+                click.echo(f"Geocoding {len(coords)} GPS locations...")
+                requested = geocoder.prefetch(coords)
+                click.echo(f"  {requested} Nominatim lookups")
+
+        for i, file_path, photo_id, folder_meta, exif in pending:
+            try:
                 place_id, place_source = get_place_id_for_photo(db, exif, folder_meta.place, geocoder)
 
                 if place_id:
@@ -963,7 +1115,9 @@ def places(directory: Path, root: Path | None, extensions: str, verbose: bool, n
                         photo_id=photo_id,
                         original_filename=file_path.name,
                         place_id=place_id,
+                        manual_edits=manual_edits,
                     )
+                    db.commit()
                     existing_places[photo_id] = place_id
                     resolved += 1
                 else:
@@ -971,6 +1125,7 @@ def places(directory: Path, root: Path | None, extensions: str, verbose: bool, n
                     if verbose:
                         click.echo(f"[{i}/{len(files)}] {file_path.relative_to(directory)} - no place data")
             except Exception as e:
+                db.rollback()
                 click.echo(f"  Error: {e}", err=True)
                 errors += 1
 
@@ -982,7 +1137,9 @@ def places(directory: Path, root: Path | None, extensions: str, verbose: bool, n
 @click.argument("directory", type=click.Path(exists=True, file_okay=False, path_type=Path))
 @click.option("--extensions", default=EXTENSIONS_DEFAULT, help="Comma-separated file extensions")
 @click.option("--verbose", "-v", is_flag=True, help="Show detailed processing information")
-def detect_faces(directory: Path, extensions: str, verbose: bool):
+@click.option("--workers", default=1, type=click.IntRange(min=1),
+              help="Files decoded and written concurrently (detection itself runs one at a time)")
+def detect_faces(directory: Path, extensions: str, verbose: bool, workers: int):
     """Detect faces in photos using InsightFace.
 
     Requires metadata stage to have been run first. Photos that previously had
@@ -997,62 +1154,61 @@ def detect_faces(directory: Path, extensions: str, verbose: bool):
     face_detector = get_detector()
     click.echo(" done.")
 
-    with Database(config.postgres_host, config.postgres_database, config.postgres_user) as db:
+    # One pooled connection per worker (each commits its own photos), plus one for the index.
+    # Only face rows are written, so commits needn't wait for the WAL flush: faces lost
+    # to a server crash are simply detected again on the next run.
+    with Database(config.postgres_host, config.postgres_database, config.postgres_user,
+                  max_connections=workers + 1, synchronous_commit=False) as db:
         click.echo("Fetching existing data...", nl=False)
-        existing_photo_ids = db.get_all_photo_ids()
-        existing_face_photo_ids = db.get_all_face_photo_ids()
+        index = db.load_startup_index(embeddings=False)
+        existing_photo_ids = index.photo_ids
+        existing_face_photo_ids = index.face_photo_ids
         click.echo(f" {len(existing_face_photo_ids)} photos already have faces")
 
-        processed = 0
-        skipped = 0
-        not_in_db = 0
-        errors = 0
-
-        for i, file_path in enumerate(files, 1):
-            photo_id = compute_sha256(file_path)
+        photo_ids = compute_sha256_many(files)
 
+        def detect_one(i: int, file_path: Path, photo_id: str) -> str:
+            label = f"[{i}/{len(files)}] {file_path.relative_to(directory)}"
             if photo_id not in existing_photo_ids:
-                not_in_db += 1
                 if verbose:
-                    click.echo(f"[{i}/{len(files)}] {file_path.relative_to(directory)} - not in DB, run metadata first")
-                continue
+                    click.echo(f"{label} - not in DB, run metadata first")
+                return "not_in_db"
 
             if photo_id in existing_face_photo_ids:
-                skipped += 1
                 if verbose:
-                    click.echo(f"[{i}/{len(files)}] {file_path.relative_to(directory)} - skip")
-                continue
+                    click.echo(f"{label} - skip")
+                return "skipped"
 
             try:
-                click.echo(f"[{i}/{len(files)}] {file_path.relative_to(directory)}", nl=False)
                 with load_image_with_orientation(file_path) as img:
                     faces = face_detector.detect(img)
-                for face in faces:
-                    db.create_face(
-                        photo_id=photo_id,
-                        bbox_x=face.bbox_x,
-                        bbox_y=face.bbox_y,
-                        bbox_width=face.bbox_width,
-                        bbox_height=face.bbox_height,
-                        embedding=face.embedding,
-                    )
-                click.echo(f" - {len(faces)} faces")
+                db.create_faces_bulk(photo_id, faces)
+                db.commit()
+                # One line per photo once it is done, so concurrent workers don't interleave
+                click.echo(f"{label} - {len(faces)} faces")
                 if faces:
                     existing_face_photo_ids.add(photo_id)
-                processed += 1
+                return "processed"
             except Exception as e:
-                click.echo(f" - Error: {e}", err=True)
-                errors += 1
+                db.rollback()
+                click.echo(f"{label} - Error: {e}", err=True)
+                return "error"
 
-    click.echo(f"\nDone! Processed: {processed}, Skipped: {skipped}, "
-               f"Not in DB: {not_in_db}, Errors: {errors}")
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            results = list(executor.map(detect_one, range(1, len(files) + 1), files, photo_ids))
+
+    click.echo(f"\nDone! Processed: {results.count('processed')}, "
+               f"Skipped: {results.count('skipped')}, "
+               f"Not in DB: {results.count('not_in_db')}, Errors: {results.count('error')}")
 
 
 @cli.command(name="generate-embeddings")
 @click.argument("directory", type=click.Path(exists=True, file_okay=False, path_type=Path))
 @click.option("--extensions", default=EXTENSIONS_DEFAULT, help="Comma-separated file extensions")
 @click.option("--verbose", "-v", is_flag=True, help="Show detailed processing information")
-def generate_embeddings(directory: Path, extensions: str, verbose: bool):
+@click.option("--batch-size", default=32, type=click.IntRange(min=1),
+              help="Images per DINOv2 forward pass")
+def generate_embeddings(directory: Path, extensions: str, verbose: bool, batch_size: int):
     """Generate DINOv2 similarity embeddings for photos.
 
     Requires metadata stage to have been run first.
@@ -1066,20 +1222,44 @@ def generate_embeddings(directory: Path, extensions: str, verbose: bool):
     embedder = get_embedder()
     click.echo(" done.")
 
-    with Database(config.postgres_host, config.postgres_database, config.postgres_user) as db:
+    # Only embedding rows are written; any lost to a server crash are regenerated next run
+    with Database(config.postgres_host, config.postgres_database, config.postgres_user,
+                  synchronous_commit=False) as db:
         click.echo("Fetching existing data...", nl=False)
-        existing_photo_ids = db.get_all_photo_ids()
-        existing_embeddings = db.get_all_embedding_photo_ids()
+        index = db.load_startup_index(faces=False)
+        existing_photo_ids = index.photo_ids
+        existing_embeddings = index.embedding_photo_ids
         click.echo(f" {len(existing_embeddings)} photos already have embeddings")
 
         generated = 0
         skipped = 0
         not_in_db = 0
         errors = 0
+        # Preprocessed images waiting for the next batched forward pass
+        pending: list[tuple[str, torch.Tensor]] = []
 
-        for i, file_path in enumerate(files, 1):
-            photo_id = compute_sha256(file_path)
+        def flush() -> None:
+            nonlocal generated, errors
+            if not pending:
+                return
+            try:
+                embeddings = embedder.embed_batch([pixels for _, pixels in pending])
+                for (photo_id, _), embedding in zip(pending, embeddings):
+                    db.create_image_embedding(photo_id, embedding)
+                # One commit per batch
+                db.commit()
+                existing_embeddings.update(photo_id for photo_id, _ in pending)
+                generated += len(pending)
+            except Exception as e:
+                db.rollback()
+                click.echo(f"  Error: {e}", err=True)
+                errors += len(pending)
+            pending.clear()
 
+        photo_ids = compute_sha256_many(files)
+
+        todo: list[tuple[int, Path, str]] = []
+        for i, (file_path, photo_id) in enumerate(zip(files, photo_ids), 1):
             if photo_id not in existing_photo_ids:
                 not_in_db += 1
                 if verbose:
@@ -1092,16 +1272,37 @@ def generate_embeddings(directory: Path, extensions: str, verbose: bool):
                     click.echo(f"[{i}/{len(files)}] {file_path.relative_to(directory)} - skip")
                 continue
 
-            try:
-                click.echo(f"[{i}/{len(files)}] {file_path.relative_to(directory)}")
-                with load_image_with_orientation(file_path) as img:
-                    embedding = embedder.generate(img)
-                db.create_image_embedding(photo_id, embedding)
-                existing_embeddings.add(photo_id)
-                generated += 1
-            except Exception as e:
-                click.echo(f"  Error: {e}", err=True)
-                errors += 1
+            todo.append((i, file_path, photo_id))
+
+        def load(file_path: Path) -> "torch.Tensor":
+            with _load_embedding_input(embedder, file_path) as img:
+                return embedder.preprocess(img)
+
+        # Decode up to two batches ahead on threads while the model runs on the current one
+        with ThreadPoolExecutor(max_workers=min(batch_size, os.cpu_count() or 1)) as executor:
+            upcoming = iter(todo)
+            inflight: deque[tuple[int, Path, str, Future]] = deque(
+                (i, file_path, photo_id, executor.submit(load, file_path))
+                for i, file_path, photo_id in islice(upcoming, 2 * batch_size)
+            )
+            while inflight:
+                i, file_path, photo_id, future = inflight.popleft()
+                next_item = next(upcoming, None)
+                if next_item is not None:
+                    inflight.append((*next_item, executor.submit(load, next_item[1])))
+
+                try:
+                    click.echo(f"[{i}/{len(files)}] {file_path.relative_to(directory)}")
+                    pending.append((photo_id, future.result()))
+                except Exception as e:
+                    click.echo(f"  Error: {e}", err=True)
+                    errors += 1
+                    continue
+
+                if len(pending) >= batch_size:
+                    flush()
+
+        flush()
 
     click.echo(f"\nDone! Generated: {generated}, Skipped: {skipped}, "
                f"Not in DB: {not_in_db}, Errors: {errors}")
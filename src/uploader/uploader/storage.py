@@ -1,24 +1,54 @@
 """Azure Blob Storage operations."""
 
+import os
 from pathlib import Path
 
+import requests
+from azure.core.pipeline.transport import RequestsTransport
 from azure.identity import DefaultAzureCredential
-from azure.storage.blob import BlobServiceClient
+from azure.storage.blob import BlobServiceClient, ContainerClient
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+# Parallel block uploads for originals too large for a single put (RAW files, panoramas)
+UPLOAD_MAX_CONCURRENCY = 8
 
 
 class BlobStorage:
     """Azure Blob Storage client for photo uploads."""
 
-    def __init__(self, account_name: str):
+    def __init__(self, account_name: str, max_connections: int = 10):
         """Initialize blob storage client.
 
         Args:
             account_name: Azure storage account name.
+            max_connections: Connections kept open to the account. Size this to
+                the number of uploads run concurrently so none are discarded.
         """
         self.account_name = account_name
         credential = DefaultAzureCredential()
         account_url = f"https://{account_name}.blob.core.windows.net"
-        self.client = BlobServiceClient(account_url, credential=credential)
+
+        # Same setup as the SDK's default session (its own retry policy handles retries),
+        # but with a pool large enough for concurrent uploads
+        session = requests.Session()
+        adapter = HTTPAdapter(
+            pool_maxsize=max_connections,
+            max_retries=Retry(total=False, redirect=False, raise_on_status=False),
+        )
+        session.mount("https://", adapter)
+        transport = RequestsTransport(session=session)
+        self.client = BlobServiceClient(account_url, credential=credential, transport=transport)
+        self._containers: dict[str, ContainerClient] = {}
+
+    def _container(self, name: str) -> ContainerClient:
+        """Container client for name, created once per storage instance."""
+        container_client = self._containers.get(name)
+        if container_client is None:
+            container_client = self._containers.setdefault(
+                name, self.client.get_container_client(name)
+            )
+        return container_client
 
     def upload_original(self, file_path: Path, photo_id: str) -> str:
         """Upload original photo to blob storage.
@@ -30,7 +60,7 @@ class BlobStorage:
         Returns:
             URL of the uploaded blob.
         """
-        container_client = self.client.get_container_client("originals")
+        container_client = self._container("originals")
 
         # Determine content type based on extension
         suffix = file_path.suffix.lower()
@@ -44,7 +74,14 @@ class BlobStorage:
         blob_client = container_client.get_blob_client(photo_id)
 
         with open(file_path, "rb") as f:
-            blob_client.upload_blob(f, content_type=content_type, overwrite=True)
+            # Stream the file itself; knowing the size, the SDK picks single put vs blocks
+            blob_client.upload_blob(
+                f,
+                length=os.fstat(f.fileno()).st_size,
+                content_type=content_type,
+                overwrite=True,
+                max_concurrency=UPLOAD_MAX_CONCURRENCY,
+            )
 
         return blob_client.url
 
@@ -60,7 +97,7 @@ class BlobStorage:
         Returns:
             URL of the uploaded blob.
         """
-        container_client = self.client.get_container_client(container)
+        container_client = self._container(container)
         blob_client = container_client.get_blob_client(blob_name)
         blob_client.upload_blob(data, content_type=content_type, overwrite=True)
         return blob_client.url
@@ -83,7 +120,7 @@ class BlobStorage:
         Returns:
             True if blob exists.
         """
-        container_client = self.client.get_container_client(container)
+        container_client = self._container(container)
         blob_client = container_client.get_blob_client(blob_name)
         return blob_client.exists()
 
@@ -96,8 +133,6 @@ class BlobStorage:
         Returns:
             Set of blob names.
         """
-        container_client = self.client.get_container_client(container)
-        blob_names = set()
-        for blob in container_client.list_blobs():
-            blob_names.add(blob.name)
-        return blob_names
+        container_client = self._container(container)
+        # Names only: skips building a BlobProperties object for every blob in the container
+        return set(container_client.list_blob_names())